@@ -0,0 +1,17 @@
+"""
+Football results scraper and analysis tools.
+
+Data comes from football-data.co.uk. Submodules are imported on demand so
+that `import football` (and the `football` CLI) start quickly:
+
+    football.config      leagues, seasons and paths (no third-party imports)
+    football.ingest      download CSVs and build football.db
+    football.archive     frozen Parquet archive of completed seasons
+    football.analysis    DuckDB reports over all matches
+    football.queries     team, head-to-head and league table queries
+    football.simulate    Monte Carlo season simulator
+    football.goal_model  Poisson / Dixon-Coles goal model
+    football.match_store compact in-memory match DataFrames
+"""
+
+__version__ = '0.1.0'
@@ -0,0 +1,5 @@
+import sys
+
+from football.cli import main
+
+sys.exit(main())
@@ -0,0 +1,432 @@
+"""DuckDB analysis reports over all matches"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import duckdb
+
+from football import archive
+from football.config import DATA_DIR
+
+# In-memory DuckDB connection, created on first use
+_con = None
+
+def connection():
+    """Return the shared in-memory DuckDB connection"""
+    global _con
+    if _con is None:
+        _con = duckdb.connect()
+    return _con
+
+def __getattr__(name):
+    # Keep `analysis.con` working without connecting at import time
+    if name == 'con':
+        return connection()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def setup_view():
+    """Create a unified view of all matches"""
+    # Completed seasons are read from the frozen Parquet archive; only the
+    # open season's CSV files are scanned (see archive.py)
+    archive.create_views(connection(), DATA_DIR)
+    print("✓ Created unified view of all matches")
+
+# Report queries. {matches} is a table of individual matches and
+# {league_season} holds the per league/season aggregates (see archive.py),
+# so every per-league and per-season report is a roll-up of one scan.
+REPORTS = {
+    'basic_stats': {
+        'total': "SELECT SUM(matches) as total_matches FROM {league_season}",
+        'per_league': """
+            SELECT League, SUM(matches) as matches
+            FROM {league_season}
+            GROUP BY League
+            ORDER BY matches DESC
+        """,
+        'per_season': """
+            SELECT Season, SUM(matches) as matches
+            FROM {league_season}
+            GROUP BY Season
+            ORDER BY Season DESC
+        """,
+    },
+    'home_advantage': {
+        'leagues': """
+            SELECT
+                League,
+                SUM(results) as total_matches,
+                SUM(home_wins) as home_wins,
+                SUM(draws) as draws,
+                SUM(away_wins) as away_wins,
+                ROUND(100.0 * SUM(home_wins) / SUM(results), 1) as home_win_pct,
+                ROUND(SUM(result_home_goals) / NULLIF(SUM(result_home_goals_n), 0), 2) as avg_home_goals,
+                ROUND(SUM(result_away_goals) / NULLIF(SUM(result_away_goals_n), 0), 2) as avg_away_goals
+            FROM {league_season}
+            GROUP BY League
+            HAVING SUM(results) > 0
+            ORDER BY home_win_pct DESC
+        """,
+    },
+    'top_scorers': {
+        'teams': """
+            WITH team_goals AS (
+                SELECT HomeTeam as team, SUM(FTHG) as goals FROM {matches} GROUP BY HomeTeam
+                UNION ALL
+                SELECT AwayTeam as team, SUM(FTAG) as goals FROM {matches} GROUP BY AwayTeam
+            )
+            SELECT team, SUM(goals) as total_goals
+            FROM team_goals
+            GROUP BY team
+            ORDER BY total_goals DESC
+            LIMIT 10
+        """,
+    },
+    'high_scoring_matches': {
+        'matches': """
+            SELECT
+                Date,
+                League,
+                HomeTeam,
+                AwayTeam,
+                FTHG,
+                FTAG,
+                (FTHG + FTAG) as total_goals
+            FROM {matches}
+            WHERE FTHG IS NOT NULL AND FTAG IS NOT NULL
+            ORDER BY total_goals DESC
+            LIMIT 10
+        """,
+    },
+    'goals_trends': {
+        'seasons': """
+            SELECT
+                Season,
+                SUM(scored) as matches,
+                ROUND((SUM(scored_home_goals) + SUM(scored_away_goals)) / SUM(scored), 2) as avg_goals_per_match,
+                ROUND(SUM(scored_home_goals) / SUM(scored), 2) as avg_home_goals,
+                ROUND(SUM(scored_away_goals) / SUM(scored), 2) as avg_away_goals
+            FROM {league_season}
+            GROUP BY Season
+            HAVING SUM(scored) > 0
+            ORDER BY Season DESC
+        """,
+    },
+    'league_comparison': {
+        'leagues': """
+            SELECT
+                League,
+                SUM(matches) as matches,
+                ROUND((SUM(scored_home_goals) + SUM(scored_away_goals)) / NULLIF(SUM(scored), 0), 2) as avg_goals,
+                ROUND(100.0 * SUM(home_wins) / SUM(matches), 1) as home_win_pct,
+                ROUND(100.0 * SUM(draws) / SUM(matches), 1) as draw_pct,
+                ROUND(SUM(shots) / NULLIF(SUM(shots_n), 0), 1) as avg_shots,
+                ROUND(SUM(corners) / NULLIF(SUM(corners_n), 0), 1) as avg_corners
+            FROM {league_season}
+            WHERE Season = '2425'
+            GROUP BY League
+            ORDER BY League
+        """,
+    },
+}
+
+# Standalone report functions query the views directly
+VIEW_SOURCES = {'matches': 'all_matches', 'league_season': 'league_season_stats'}
+# The report runner scans the views once into these tables
+SHARED_SOURCES = {'matches': 'report_matches', 'league_season': 'report_league_season'}
+
+def run_report(name, cursor=None, sources=VIEW_SOURCES, output_dir=None):
+    """
+    Run one report's queries and return {query: {'columns': [...], 'rows': [...]}}.
+
+    With output_dir, each query result is also written to
+    <output_dir>/<report>__<query>.parquet.
+    """
+    cursor = cursor or connection()
+    results = {}
+    for query_name, sql in REPORTS[name].items():
+        table = f"result_{name}__{query_name}"
+        cursor.execute(f"CREATE OR REPLACE TEMP TABLE {table} AS {sql.format(**sources)}")
+        result = cursor.execute(f"SELECT * FROM {table}")
+        results[query_name] = {
+            'columns': [desc[0] for desc in result.description],
+            'rows': result.fetchall(),
+        }
+        if output_dir is not None:
+            cursor.execute(f"""
+                COPY {table} TO '{Path(output_dir) / f"{name}__{query_name}.parquet"}'
+                (FORMAT PARQUET)
+            """)
+        cursor.execute(f"DROP TABLE {table}")
+    return results
+
+def prepare_shared_tables():
+    """Materialise the views every report reads from, scanning all_matches once"""
+    con = connection()
+    # Only the columns of the match-level reports (top_scorers, high_scoring_matches)
+    con.execute("""
+        CREATE OR REPLACE TABLE report_matches AS
+        SELECT Date, League, HomeTeam, AwayTeam, FTHG, FTAG
+        FROM all_matches
+    """)
+    # Frozen seasons come precomputed from the archive, the rest in one scan
+    con.execute("""
+        CREATE OR REPLACE TABLE report_league_season AS
+        SELECT * FROM league_season_stats
+    """)
+
+def run_reports(names=None, output_dir=None, workers=None):
+    """
+    Run reports concurrently on separate cursors over one shared scan.
+
+    Returns {report: {query: {'columns', 'rows'}}}, in REPORTS order.
+    """
+    names = list(names or REPORTS)
+    if output_dir is not None:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    prepare_shared_tables()
+
+    def run(name):
+        cursor = connection().cursor()
+        try:
+            return run_report(name, cursor, SHARED_SOURCES, output_dir)
+        finally:
+            cursor.close()
+
+    with ThreadPoolExecutor(max_workers=workers or len(names)) as pool:
+        return dict(zip(names, pool.map(run, names)))
+
+def _json_value(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+def write_json(results, output_dir):
+    """Write report results as <output_dir>/reports.json for machine consumption"""
+    path = Path(output_dir) / 'reports.json'
+    payload = {
+        'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'reports': {
+            name: {
+                query: [dict(zip(result['columns'], row)) for row in result['rows']]
+                for query, result in queries.items()
+            }
+            for name, queries in results.items()
+        },
+    }
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=2, default=_json_value)
+    return path
+
+def print_basic_stats(result):
+    print("\n=== Basic Statistics ===")
+
+    # Total matches
+    total = result['total']['rows'][0][0] or 0
+    print(f"Total matches: {total:,}")
+
+    # Matches per league
+    print("\nMatches per league:")
+    for league, count in result['per_league']['rows']:
+        print(f"  {league}: {count:,}")
+
+    # Matches per season
+    print("\nMatches per season:")
+    for season, count in result['per_season']['rows']:
+        print(f"  {season}: {count:,}")
+
+def print_home_advantage(result):
+    print("\n=== Home Advantage Analysis ===")
+
+    for row in result['leagues']['rows']:
+        league, total, hw, d, aw, hw_pct, avg_hg, avg_ag = row
+        print(f"\n{league}:")
+        print(f"  Home wins: {hw_pct}% ({hw}/{total})")
+        print(f"  Draws: {round(100*d/total, 1)}%")
+        print(f"  Away wins: {round(100*aw/total, 1)}%")
+        print(f"  Avg goals: Home {avg_hg} - Away {avg_ag}")
+
+def print_top_scorers(result):
+    print("\n=== Top Scoring Teams (All Time) ===")
+
+    for i, (team, goals) in enumerate(result['teams']['rows'], 1):
+        print(f"{i:2d}. {team:20s} {int(goals):4d} goals")
+
+def print_high_scoring_matches(result):
+    print("\n=== Highest Scoring Matches ===")
+
+    for row in result['matches']['rows']:
+        date, league, home, away, hg, ag, total = row
+        print(f"{date} [{league}] {home} {int(hg)}-{int(ag)} {away} ({int(total)} goals)")
+
+def print_goals_trends(result):
+    print("\n=== Goals Trends by Season ===")
+
+    for season, matches, avg_goals, avg_hg, avg_ag in result['seasons']['rows']:
+        print(f"{season}: {avg_goals} goals/match (H:{avg_hg} A:{avg_ag}) [{matches} matches]")
+
+def print_league_comparison(result):
+    print("\n=== League Comparison (Current Season 2425) ===")
+
+    print(f"{'League':<8} {'Matches':>7} {'Avg Goals':>10} {'Home%':>8} {'Draw%':>8} {'Shots':>8} {'Corners':>8}")
+    print("-" * 70)
+    for league, matches, goals, home_pct, draw_pct, shots, corners in result['leagues']['rows']:
+        print(f"{league:<8} {matches:>7} {goals:>10} {home_pct:>7}% {draw_pct:>7}% {shots:>8} {corners:>8}")
+
+PRINTERS = {
+    'basic_stats': print_basic_stats,
+    'home_advantage': print_home_advantage,
+    'top_scorers': print_top_scorers,
+    'high_scoring_matches': print_high_scoring_matches,
+    'goals_trends': print_goals_trends,
+    'league_comparison': print_league_comparison,
+}
+
+def basic_stats():
+    """Show basic statistics"""
+    print_basic_stats(run_report('basic_stats'))
+
+def home_advantage():
+    """Analyze home advantage across leagues"""
+    print_home_advantage(run_report('home_advantage'))
+
+def top_scorers():
+    """Find teams with most goals"""
+    print_top_scorers(run_report('top_scorers'))
+
+def high_scoring_matches():
+    """Find highest scoring matches"""
+    print_high_scoring_matches(run_report('high_scoring_matches'))
+
+def goals_trends():
+    """Analyze goals trends over seasons"""
+    print_goals_trends(run_report('goals_trends'))
+
+def league_comparison():
+    """Compare different leagues"""
+    print_league_comparison(run_report('league_comparison'))
+
+def custom_query(sql):
+    """Execute a custom SQL query"""
+    print(f"\n=== Custom Query ===")
+    print(f"SQL: {sql}\n")
+
+    result = connection().execute(sql)
+
+    # Print column names
+    columns = [desc[0] for desc in result.description]
+    print(" | ".join(columns))
+    print("-" * 80)
+
+    # Print results
+    for row in result.fetchall():
+        print(" | ".join(str(val) for val in row))
+
+def export_to_parquet():
+    """Export all CSV data to a single Parquet file for faster analysis"""
+    print("\n=== Exporting to Parquet ===")
+
+    connection().execute("""
+        COPY all_matches
+        TO 'data/all_matches.parquet'
+        (FORMAT PARQUET, COMPRESSION ZSTD)
+    """)
+
+    parquet_path = Path('data/all_matches.parquet')
+    print(f"✓ Exported to {parquet_path}")
+    print(f"  Size: {parquet_path.stat().st_size / 1024 / 1024:.2f} MB")
+
+    # Show how to load it
+    print("\nTo load from parquet in future:")
+    print("  con.execute(\"SELECT * FROM 'data/all_matches.parquet'\")")
+
+def interactive_mode():
+    """Start an interactive query session"""
+    print("\n=== Interactive Mode ===")
+    print("Enter SQL queries (type 'exit' to quit, 'help' for examples)")
+    print("Available table: all_matches")
+
+    examples = {
+        'help': "Show this help message",
+        'schema': "DESCRIBE all_matches",
+        'sample': "SELECT * FROM all_matches LIMIT 5",
+        'leagues': "SELECT DISTINCT League FROM all_matches ORDER BY League",
+        'seasons': "SELECT DISTINCT Season FROM all_matches ORDER BY Season",
+    }
+
+    print("\nQuick commands:", ", ".join(examples.keys()))
+
+    while True:
+        try:
+            query = input("\nSQL> ").strip()
+
+            if query.lower() == 'exit':
+                break
+
+            if query.lower() == 'help':
+                for cmd, sql in examples.items():
+                    print(f"  {cmd:10s} - {sql}")
+                continue
+
+            if query.lower() in examples:
+                query = examples[query.lower()]
+
+            if not query:
+                continue
+
+            result = connection().execute(query)
+
+            # Print results in a nice format
+            columns = [desc[0] for desc in result.description]
+            rows = result.fetchall()
+
+            if not rows:
+                print("(no results)")
+                continue
+
+            # Calculate column widths
+            widths = [len(col) for col in columns]
+            for row in rows:
+                for i, val in enumerate(row):
+                    widths[i] = max(widths[i], len(str(val)))
+
+            # Print header
+            header = " | ".join(col.ljust(w) for col, w in zip(columns, widths))
+            print(header)
+            print("-" * len(header))
+
+            # Print rows
+            for row in rows:
+                print(" | ".join(str(val).ljust(w) for val, w in zip(row, widths)))
+
+            print(f"\n({len(rows)} row{'s' if len(rows) != 1 else ''})")
+
+        except KeyboardInterrupt:
+            print("\nUse 'exit' to quit")
+        except Exception as e:
+            print(f"Error: {e}")
+
+def main(output_dir=None):
+    """Run all analyses"""
+    print("=== Football Data Analysis with DuckDB ===")
+
+    setup_view()
+    # One shared scan, then every report concurrently on its own cursor
+    results = run_reports(output_dir=output_dir)
+    for name, result in results.items():
+        PRINTERS[name](result)
+
+    # Optionally export to parquet
+    # export_to_parquet()
+
+    print("\n" + "="*50)
+    print("Analysis complete!")
+    if output_dir is not None:
+        json_path = write_json(results, output_dir)
+        print(f"\n✓ Wrote {json_path} and one Parquet file per query to {output_dir}/")
+    print("\nFor custom queries, use:")
+    print("  football query --interactive")
+    print("\nOr import this module and use:")
+    print("  connection().execute('YOUR SQL HERE').fetchall()")
@@ -0,0 +1,320 @@
+"""
+Frozen archive tier for completed seasons.
+
+Completed seasons never change, so they are stored once as ZSTD-compressed
+Parquet files with SHA-256 checksums and precomputed per league/season
+aggregates. Only the open season is read from the raw CSV files.
+
+duckdb is only imported when Parquet files are read or written, so listing
+and verifying the archive stays cheap.
+
+Layout:
+    archive/manifest.json            seasons, checksums, row counts
+    archive/matches/<season>.parquet one file per frozen season
+    archive/aggregates/<season>.parquet
+    archive/quarantine/<season>.parquet rows kept out by football.validation
+    archive/quality/<season>.parquet    their per-file quality metrics
+"""
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from football.config import ARCHIVE_DIR, DATA_DIR
+
+MANIFEST_NAME = 'manifest.json'
+# Manifest keys of each archived file and of its checksum
+CHECKSUM_KEYS = {'file': 'sha256', 'aggregates': 'aggregates_sha256',
+                 'quarantine': 'quarantine_sha256', 'quality': 'quality_sha256'}
+
+# Per league/season aggregates shared by the archive and the live view.
+# Sums and counts are kept separate so averages can be rolled up exactly.
+# Fill in with league_season_agg_sql(), which knows the source's columns.
+LEAGUE_SEASON_AGG_SQL = """
+    SELECT
+        League,
+        Season,
+        COUNT(*) as matches,
+        COUNT(*) FILTER (WHERE {FTR} IS NOT NULL) as results,
+        COUNT(*) FILTER (WHERE {FTR} = 'H') as home_wins,
+        COUNT(*) FILTER (WHERE {FTR} = 'D') as draws,
+        COUNT(*) FILTER (WHERE {FTR} = 'A') as away_wins,
+        SUM({FTHG}) FILTER (WHERE {FTR} IS NOT NULL) as result_home_goals,
+        COUNT({FTHG}) FILTER (WHERE {FTR} IS NOT NULL) as result_home_goals_n,
+        SUM({FTAG}) FILTER (WHERE {FTR} IS NOT NULL) as result_away_goals,
+        COUNT({FTAG}) FILTER (WHERE {FTR} IS NOT NULL) as result_away_goals_n,
+        COUNT(*) FILTER (WHERE {FTHG} IS NOT NULL AND {FTAG} IS NOT NULL) as scored,
+        SUM({FTHG}) FILTER (WHERE {FTHG} IS NOT NULL AND {FTAG} IS NOT NULL) as scored_home_goals,
+        SUM({FTAG}) FILTER (WHERE {FTHG} IS NOT NULL AND {FTAG} IS NOT NULL) as scored_away_goals,
+        SUM({HS} + {AS}) as shots,
+        COUNT({HS} + {AS}) as shots_n,
+        SUM({HC} + {AC}) as corners,
+        COUNT({HC} + {AC}) as corners_n
+    FROM {source}
+    GROUP BY League, Season
+"""
+AGG_COLUMNS = ['FTR', 'FTHG', 'FTAG', 'HS', 'AS', 'HC', 'AC']
+
+
+def league_season_agg_sql(source, columns):
+    """LEAGUE_SEASON_AGG_SQL over `source`; columns it lacks (e.g. shots in old files) are NULL"""
+    expressions = {}
+    for column in AGG_COLUMNS:
+        if column not in columns:
+            expressions[column] = "CAST(NULL AS VARCHAR)" if column == 'FTR' else "CAST(NULL AS DOUBLE)"
+        elif column in ('FTR', 'FTHG', 'FTAG'):
+            expressions[column] = column
+        else:
+            expressions[column] = f'TRY_CAST("{column}" AS DOUBLE)'
+    return LEAGUE_SEASON_AGG_SQL.format(source=source, **expressions)
+
+
+def file_sha256(path):
+    """Return the hex SHA-256 digest of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(archive_dir=ARCHIVE_DIR):
+    """Load the archive manifest (empty if the archive does not exist)"""
+    path = Path(archive_dir) / MANIFEST_NAME
+    if not path.exists():
+        return {'seasons': {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, archive_dir=ARCHIVE_DIR):
+    """Write the archive manifest atomically"""
+    path = Path(archive_dir) / MANIFEST_NAME
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    tmp_path.replace(path)
+
+
+def archived_seasons(archive_dir=ARCHIVE_DIR):
+    """Return the set of seasons frozen in the archive"""
+    archive_dir = Path(archive_dir)
+    seasons = load_manifest(archive_dir)['seasons']
+    return {season for season, entry in seasons.items()
+            if (archive_dir / entry['file']).exists()}
+
+
+def season_of(filepath):
+    """Season code of a data/<season>_<league>.csv file"""
+    return Path(filepath).stem.split('_')[0]
+
+
+def sources_unchanged(season, filepaths, archive_dir=ARCHIVE_DIR):
+    """True if a season is archived, with its quarantine, from exactly these source CSVs"""
+    entry = load_manifest(archive_dir)['seasons'].get(season)
+    # Seasons frozen before their quarantine was archived are frozen again
+    if not entry or 'quarantine' not in entry:
+        return False
+    current = {Path(p).name: file_sha256(p) for p in filepaths}
+    return current == entry['sources']
+
+
+def write_season(df, season, source_files, archive_dir=ARCHIVE_DIR, quarantined=None,
+                 metrics=None):
+    """
+    Freeze one season's matches (as loaded by the importer) into the archive.
+
+    With the quarantined rows and quality metrics from football.validation,
+    those are archived too so a rebuild can restore them.
+    """
+    archive_dir = Path(archive_dir)
+    files = {'file': Path('matches') / f"{season}.parquet",
+             'aggregates': Path('aggregates') / f"{season}.parquet"}
+    if quarantined is not None:
+        files['quarantine'] = Path('quarantine') / f"{season}.parquet"
+        files['quality'] = Path('quality') / f"{season}.parquet"
+    for path in files.values():
+        (archive_dir / path).parent.mkdir(parents=True, exist_ok=True)
+    matches_file = files['file']
+
+    import duckdb
+    con = duckdb.connect()
+    try:
+        con.register('season_df', df)
+        # Store Date as a real DATE so it unions cleanly with the CSV view
+        con.execute("""
+            CREATE TABLE season_matches AS
+            SELECT * REPLACE (TRY_CAST(Date AS DATE) AS Date) FROM season_df
+        """)
+        columns = [row[0] for row in con.execute("DESCRIBE season_matches").fetchall()]
+        con.execute(f"""
+            COPY season_matches TO '{archive_dir / matches_file}'
+            (FORMAT PARQUET, COMPRESSION ZSTD)
+        """)
+        con.execute(f"""
+            COPY ({league_season_agg_sql('season_matches', columns)})
+            TO '{archive_dir / files['aggregates']}'
+            (FORMAT PARQUET, COMPRESSION ZSTD)
+        """)
+        if quarantined is not None:
+            # Bad rows are stored as loaded (dates may not parse)
+            for key, frame in (('quarantine', quarantined), ('quality', metrics)):
+                con.register(f"{key}_df", frame)
+                con.execute(f"""
+                    COPY {key}_df TO '{archive_dir / files[key]}'
+                    (FORMAT PARQUET, COMPRESSION ZSTD)
+                """)
+    finally:
+        con.close()
+
+    entry = {
+        'rows': len(df),
+        'sources': {Path(p).name: file_sha256(p) for p in source_files},
+        'validated': quarantined is not None,
+        'frozen_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    }
+    for key, path in files.items():
+        entry[key] = str(path)
+        entry[CHECKSUM_KEYS[key]] = file_sha256(archive_dir / path)
+    if quarantined is not None:
+        entry['quarantined'] = len(quarantined)
+    manifest = load_manifest(archive_dir)
+    manifest['seasons'][season] = entry
+    save_manifest(manifest, archive_dir)
+
+    print(f"✓ Archived {season}: {len(df)} rows → {archive_dir / matches_file}")
+
+
+def read_season(season, archive_dir=ARCHIVE_DIR):
+    """Read a frozen season back as a DataFrame in the importer's format"""
+    archive_dir = Path(archive_dir)
+    entry = load_manifest(archive_dir)['seasons'][season]
+
+    import duckdb
+    con = duckdb.connect()
+    try:
+        return con.execute(f"""
+            SELECT * REPLACE (strftime(Date, '%Y-%m-%d') AS Date)
+            FROM read_parquet('{archive_dir / entry['file']}')
+        """).df()
+    finally:
+        con.close()
+
+
+def read_quality(season, archive_dir=ARCHIVE_DIR):
+    """Quarantined rows and quality metrics archived with a season (None if not archived)"""
+    archive_dir = Path(archive_dir)
+    entry = load_manifest(archive_dir)['seasons'][season]
+    if 'quarantine' not in entry:
+        return None
+
+    import duckdb
+    con = duckdb.connect()
+    try:
+        return tuple(con.execute(f"SELECT * FROM read_parquet('{archive_dir / entry[key]}')").df()
+                     for key in ('quarantine', 'quality'))
+    finally:
+        con.close()
+
+
+def verify_archive(archive_dir=ARCHIVE_DIR):
+    """Recompute checksums and return a list of problems (empty if intact)"""
+    archive_dir = Path(archive_dir)
+    problems = []
+    for season, entry in sorted(load_manifest(archive_dir)['seasons'].items()):
+        for key, checksum_key in CHECKSUM_KEYS.items():
+            if key not in entry:
+                continue
+            path = archive_dir / entry[key]
+            if not path.exists():
+                problems.append(f"{season}: missing {path}")
+            elif file_sha256(path) != entry[checksum_key]:
+                problems.append(f"{season}: checksum mismatch for {path}")
+    return problems
+
+
+def live_csv_files(data_dir=DATA_DIR, archive_dir=ARCHIVE_DIR):
+    """CSV files in data_dir whose season is not frozen"""
+    frozen = archived_seasons(archive_dir)
+    return sorted(p for p in Path(data_dir).glob('*.csv')
+                  if season_of(p) not in frozen)
+
+
+def _sql_list(paths):
+    return '[' + ', '.join(f"'{p}'" for p in paths) + ']'
+
+
+def create_views(con, data_dir=DATA_DIR, archive_dir=ARCHIVE_DIR):
+    """
+    Create the all_matches and league_season_stats views on a DuckDB connection.
+
+    Frozen seasons come from the archive's Parquet files and precomputed
+    aggregates; only the CSV files of open seasons are scanned. Rows failing
+    football.validation's checks are left out of all_matches.
+    """
+    from football import validation
+
+    archive_dir = Path(archive_dir)
+    manifest = load_manifest(archive_dir)['seasons']
+    frozen = sorted(archived_seasons(archive_dir))
+    live_files = live_csv_files(data_dir, archive_dir)
+    # No archive yet: scan every CSV, as before
+    live_source = _sql_list(live_files) if frozen else f"'{Path(data_dir)}/*.csv'"
+
+    # Rows are numbered within their file so duplicate fixtures resolve in file order
+    live_sql = f"""
+        SELECT
+            *,
+            ROW_NUMBER() OVER () as _file_row,
+            CAST(SUBSTRING(regexp_replace(filename, '.*/(\\d{{4}})_.*', '\\1'), 1, 2) ||
+                 SUBSTRING(regexp_replace(filename, '.*/(\\d{{4}})_.*', '\\1'), 3, 4) AS VARCHAR) as Season,
+            regexp_replace(filename, '.*_([A-Z0-9]+)\\.csv', '\\1') as League
+        FROM read_csv_auto({live_source}, filename=true, ignore_errors=true)
+    """
+    archive_sql = f"""
+        SELECT * EXCLUDE (file_row_number), file_row_number as _file_row
+        FROM read_parquet(
+            {_sql_list(archive_dir / manifest[s]['file'] for s in frozen)},
+            union_by_name=true, filename=true, file_row_number=true)
+    """
+
+    if frozen and live_files:
+        matches_sql = f"{live_sql}\nUNION ALL BY NAME\n{archive_sql}"
+    elif frozen:
+        matches_sql = archive_sql
+    else:
+        matches_sql = live_sql
+
+    columns = [row[0] for row in con.execute(f"DESCRIBE SELECT * FROM ({matches_sql})").fetchall()]
+    # _file_row only orders duplicates; it is not a column to check
+    checked = [c for c in columns if c != '_file_row']
+    valid_sql = validation.valid_rows_sql(matches_sql, checked, order_by='filename, _file_row')
+    con.execute(f"CREATE OR REPLACE VIEW all_matches AS "
+                f"SELECT * EXCLUDE (_file_row) FROM ({valid_sql})")
+
+    if frozen:
+        archive_aggs = f"""
+            SELECT * FROM read_parquet(
+                {_sql_list(archive_dir / manifest[s]['aggregates'] for s in frozen)})
+        """
+        frozen_list = ', '.join(f"'{s}'" for s in frozen)
+        live_matches = f"(SELECT * FROM all_matches WHERE Season NOT IN ({frozen_list}))"
+        live_aggs = league_season_agg_sql(live_matches, columns)
+        stats_sql = f"{archive_aggs}\nUNION ALL BY NAME\n{live_aggs}" if live_files else archive_aggs
+    else:
+        stats_sql = league_season_agg_sql('all_matches', columns)
+
+    con.execute(f"CREATE OR REPLACE VIEW league_season_stats AS {stats_sql}")
+
+
+def report(archive_dir=ARCHIVE_DIR):
+    """Print the frozen seasons and verify their checksums; False if damaged"""
+    problems = verify_archive(archive_dir)
+    seasons = sorted(archived_seasons(archive_dir))
+    print(f"Frozen seasons: {', '.join(seasons) if seasons else '(none)'}")
+    if problems:
+        for problem in problems:
+            print(f"✗ {problem}")
+        return False
+    print("✓ Archive checksums verified")
+    return True
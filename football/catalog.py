@@ -0,0 +1,252 @@
+"""
+Full-archive ingestion: every football-data.co.uk league and season.
+
+The main leagues publish one CSV per season (mmz4281/<season>/<league>.csv,
+back to 1993/94); the extra leagues publish one CSV per league covering all
+seasons (new/<league>.csv). The catalog of available files is discovered from
+the country pages and cached in data/catalog.json.
+
+Files are downloaded to data/catalog/ and streamed into the matches table one
+at a time, so memory stays at one file whatever the size of the history.
+Column names are reconciled with ingest.normalise_columns, bad rows are
+quarantined by football.validation and columns that only some files have are
+added to the table as they appear.
+"""
+import json
+import re
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+
+from football import archive, ingest, validation
+from football.config import (SITE_URL, BASE_URL, CURRENT_SEASON, FIRST_SEASON, DATA_DIR,
+                             CATALOG_DIR, DB_PATH, season_start_year)
+
+CATALOG_PATH = DATA_DIR / 'catalog.json'
+
+# Country pages linking the per-season main-league files
+MAIN_PAGES = ['englandm.php', 'scotlandm.php', 'germanym.php', 'italym.php', 'spainm.php',
+              'francem.php', 'netherlandsm.php', 'belgiumm.php', 'portugalm.php',
+              'turkeym.php', 'greecem.php']
+# Country pages linking the all-seasons extra-league files
+EXTRA_PAGES = ['argentina.php', 'austria.php', 'brazil.php', 'china.php', 'denmark.php',
+               'finland.php', 'ireland.php', 'japan.php', 'mexico.php', 'norway.php',
+               'poland.php', 'romania.php', 'russia.php', 'sweden.php', 'switzerland.php',
+               'usa.php']
+
+MAIN_LINK = re.compile(r'mmz4281/(\d{4})/(\w+)\.csv')
+EXTRA_LINK = re.compile(r'new/(\w+)\.csv')
+
+# Ingested files and their checksums, so unchanged files are skipped on re-runs.
+# Extra-league files also record the `since` they were filtered with.
+LOG_TABLE = 'catalog_files'
+
+
+def season_code(value):
+    """Season code of an extra-league Season value ('2012/2013' -> '1213', 2012 -> '1212')"""
+    if isinstance(value, float):
+        # A blank padding row makes pandas read a calendar-year Season column as float
+        value = int(value)
+    value = str(value).strip()
+    if '/' in value:
+        start, end = value.split('/')
+        return start[-2:] + end[-2:]
+    # Calendar-year leagues (e.g. Brazil, Norway) play one season per year
+    return value[-2:] * 2
+
+
+def discover(pages=MAIN_PAGES, extra_pages=EXTRA_PAGES):
+    """Find the available (season, league) files by scanning the country pages"""
+    import requests
+
+    entries = {}
+    session = requests.Session()
+    for page in pages + extra_pages:
+        try:
+            response = session.get(f"{SITE_URL}/{page}", timeout=10)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"✗ Failed {page}: {e}")
+            continue
+
+        for season, league in MAIN_LINK.findall(response.text):
+            entries[f"{season}_{league}"] = {
+                'season': season, 'league': league, 'file': f"{season}_{league}.csv",
+                'url': f"{BASE_URL}/{season}/{league}.csv"}
+        for league in EXTRA_LINK.findall(response.text):
+            entries[f"new_{league}"] = {
+                'season': None, 'league': league, 'file': f"new_{league}.csv",
+                'url': f"{SITE_URL}/new/{league}.csv"}
+        time.sleep(0.5)  # Be nice to the server
+
+    catalog = sorted(entries.values(), key=lambda e: (e['league'], e['season'] or ''))
+    print(f"✓ Discovered {len(catalog)} files")
+    return catalog
+
+
+def load_catalog(path=CATALOG_PATH):
+    """Catalog entries saved by the last discovery (empty if none)"""
+    path = Path(path)
+    if not path.exists():
+        return []
+    return json.loads(path.read_text())['files']
+
+
+def save_catalog(catalog, path=CATALOG_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        'discovered_at': datetime.now().isoformat(timespec='seconds'),
+        'files': catalog,
+    }, indent=2))
+
+
+def get_catalog(refresh=False, path=CATALOG_PATH):
+    """Cached catalog, rediscovered when asked to or when there is none"""
+    catalog = [] if refresh else load_catalog(path)
+    if not catalog:
+        catalog = discover()
+        if catalog:
+            save_catalog(catalog, path)
+        else:
+            # Offline: keep using the previous discovery
+            catalog = load_catalog(path)
+    return catalog
+
+
+def select(catalog, since=FIRST_SEASON, leagues=None):
+    """Catalog entries for the given leagues from season `since` onwards"""
+    first_year = season_start_year(since)
+    return [e for e in catalog
+            if (leagues is None or e['league'] in leagues)
+            and (e['season'] is None or season_start_year(e['season']) >= first_year)]
+
+
+def is_final(entry):
+    """Completed main-league seasons never change once downloaded"""
+    return entry['season'] is not None and entry['season'] != CURRENT_SEASON
+
+
+def download(entry, session, catalog_dir=CATALOG_DIR, refresh=False):
+    """Download one catalog file unless a final copy is already on disk"""
+    import requests
+
+    filepath = Path(catalog_dir) / entry['file']
+    if filepath.exists() and is_final(entry) and not refresh:
+        return filepath
+
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        response = session.get(entry['url'], timeout=30)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        print(f"✗ Failed {entry['file']}: {e}")
+        return filepath if filepath.exists() else None
+
+    filepath.write_bytes(response.content)
+    print(f"✓ Downloaded {entry['file']}")
+    time.sleep(0.5)  # Be nice to the server
+    return filepath
+
+
+def load_entry(entry, filepath, since=FIRST_SEASON):
+    """Load a catalog file as canonical matches rows"""
+    df = ingest.normalise_columns(ingest.read_football_csv(filepath))
+    df = ingest.iso_dates(df)
+
+    if entry['season'] is None:
+        # Extra leagues: one file per league, with a Season column and the league's name
+        df = df.rename(columns={'League': 'League_Name'}).dropna(subset=['Season'])
+        df['Season'] = df['Season'].map(season_code)
+        in_range = df['Season'].map(season_start_year) >= season_start_year(since)
+        df = df[in_range].copy()
+        df['Div'] = entry['league']
+    else:
+        df['Season'] = entry['season']
+    df['League'] = entry['league']
+    df['Source_File'] = entry['file']
+    return df
+
+
+def write_file(conn, df, source_file):
+    """Replace one source file's rows in the matches table"""
+    if ingest.table_exists(conn, 'matches'):
+        conn.execute("DELETE FROM matches WHERE Source_File = ?", (source_file,))
+        ingest.ensure_columns(conn, df)
+    df.to_sql('matches', conn, if_exists='append', index=False, chunksize=10_000)
+
+
+def ingested_checksums(conn):
+    """(checksum, since) of the files whose rows are all still in the matches table"""
+    conn.execute(f"""CREATE TABLE IF NOT EXISTS {LOG_TABLE}
+                     (Source_File TEXT PRIMARY KEY, sha256 TEXT, rows INTEGER,
+                      ingested_at TEXT, since TEXT)""")
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({LOG_TABLE})")}
+    if 'since' not in columns:
+        conn.execute(f"ALTER TABLE {LOG_TABLE} ADD COLUMN since TEXT")
+    if not ingest.table_exists(conn, 'matches'):
+        return {}
+    # A rebuild (football download / rebuild) replaces the table behind the log's back
+    counts = dict(conn.execute("SELECT Source_File, COUNT(*) FROM matches GROUP BY Source_File"))
+    return {source: (sha256, since) for source, sha256, rows, since
+            in conn.execute(f"SELECT Source_File, sha256, rows, since FROM {LOG_TABLE}")
+            if counts.get(source, 0) == rows}
+
+
+def ingest_catalog(db_path=DB_PATH, since=FIRST_SEASON, leagues=None, refresh=False,
+                   catalog_dir=CATALOG_DIR):
+    """Download and stream every catalog file into the matches table"""
+    import requests
+
+    entries = select(get_catalog(refresh), since, leagues)
+    print(f"{len(entries)} files from {since} onwards")
+
+    session = requests.Session()
+    conn = sqlite3.connect(db_path)
+    checksums = ingested_checksums(conn)
+    total = skipped = 0
+    for entry in entries:
+        filepath = download(entry, session, catalog_dir, refresh)
+        if filepath is None:
+            continue
+
+        sha256 = archive.file_sha256(filepath)
+        # Extra-league files hold every season, so a different `since` changes their rows
+        file_since = since if entry['season'] is None else None
+        if checksums.get(entry['file']) == (sha256, file_since):
+            skipped += 1
+            continue
+
+        try:
+            df = load_entry(entry, filepath, since)
+        except Exception as e:
+            print(f"✗ Error loading {entry['file']}: {e}")
+            continue
+
+        df, quarantined, metrics = validation.validate(df)
+        write_file(conn, df, entry['file'])
+        ingest.store_quality(conn, quarantined, metrics)
+        conn.execute(f"""INSERT OR REPLACE INTO {LOG_TABLE}
+                         (Source_File, sha256, rows, ingested_at, since)
+                         VALUES (?, ?, ?, ?, ?)""",
+                     (entry['file'], sha256, len(df),
+                      datetime.now().isoformat(timespec='seconds'), file_since))
+        conn.commit()  # One transaction per file: an interrupted run resumes where it stopped
+        total += len(df)
+        print(f"✓ Ingested {entry['file']}: {len(df)} rows")
+
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_date ON matches(Date)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_league ON matches(League)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_season ON matches(Season)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_teams ON matches(HomeTeam, AwayTeam)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_source ON matches(Source_File)')
+    conn.commit()
+    conn.close()
+
+    print(f"\n✓ {total} rows ingested into {db_path} ({skipped} files unchanged)")
+
+
+def main(db_path=DB_PATH, since=FIRST_SEASON, leagues=None, refresh=False):
+    print("=== Ingesting Full Archive ===")
+    ingest_catalog(db_path, since, leagues, refresh)
@@ -0,0 +1,193 @@
+"""
+The `football` command line interface.
+
+Only argparse and football.config are imported at startup; each subcommand
+imports the modules it needs (pandas, duckdb, numpy, scipy, requests) when
+it runs, so `football --help` starts in tens of milliseconds.
+"""
+import argparse
+import sys
+
+from football.config import CURRENT_SEASON, DB_PATH, FIRST_SEASON, LEAGUES
+
+
+def cmd_download(args):
+    from football import ingest
+    ingest.main()
+
+
+def cmd_catalog(args):
+    from football import catalog
+    catalog.main(args.db, since=args.since, leagues=args.leagues, refresh=args.refresh)
+
+
+def cmd_sync(args):
+    from football import ingest
+    ingest.update()
+
+
+def cmd_freeze(args):
+    if args.verify:
+        from football import archive
+        return 0 if archive.report() else 1
+    from football import ingest
+    ingest.freeze()
+
+
+def cmd_rebuild(args):
+    from football import rebuild
+    rebuild.main(args.db, assume_yes=args.yes)
+
+
+def cmd_report(args):
+    from football import analysis
+    analysis.main(args.output_dir)
+
+
+def cmd_query(args):
+    if args.table:
+        from football import queries
+        queries.league_table(args.table, args.season)
+    elif args.team:
+        from football import queries
+        queries.team_season_stats(args.team, args.season)
+    elif args.form:
+        from football import queries
+        queries.form_guide(args.form, season=args.season)
+    elif args.h2h:
+        from football import queries
+        queries.head_to_head(*args.h2h)
+    else:
+        from football import analysis
+        analysis.setup_view()
+        if args.sql:
+            analysis.custom_query(args.sql)
+        if args.interactive or not args.sql:
+            analysis.interactive_mode()
+
+
+def cmd_shell(args):
+    import os
+    import subprocess
+
+    import duckdb
+    from football import archive
+
+    # Temporary DuckDB database with a view of all matches
+    # (frozen seasons come from archive/, the open season from data/*.csv)
+    db_path = 'football_temp.db'
+    con = duckdb.connect(db_path)
+    archive.create_views(con)
+    con.close()
+    print('✓ Database view created')
+
+    print()
+    print("=== Launching Harlequin ===")
+    print()
+    print("Quick tips:")
+    print("  - Use UP/DOWN arrows to browse tables")
+    print("  - Press ENTER on 'all_matches' to see the schema")
+    print("  - Type SQL in the editor and press Ctrl+Enter to run")
+    print("  - Press Ctrl+Q to quit")
+    print()
+    print("Sample query to get started:")
+    print("  SELECT * FROM all_matches LIMIT 10;")
+    print()
+
+    try:
+        return subprocess.call([sys.executable, '-m', 'harlequin', db_path])
+    finally:
+        if os.path.exists(db_path):
+            os.remove(db_path)
+
+
+def cmd_simulate(args):
+    from football import simulate
+    simulate.main(args.season, args.leagues or LEAGUES, args.sims, args.seed)
+
+
+def cmd_fit(args):
+    from football import goal_model
+    goal_model.fit_all(args.db, xi=args.xi, full=args.full)
+
+
+def cmd_store(args):
+    from football import match_store
+    match_store.memory_report(args.db)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='football', description="Football results scraper and analysis tools")
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+    subparsers.required = True
+
+    p = subparsers.add_parser('download', help="Download all CSVs and create football.db")
+    p.set_defaults(func=cmd_download)
+
+    p = subparsers.add_parser('catalog',
+                              help="Ingest every football-data league and season into football.db")
+    p.add_argument('--db', default=DB_PATH)
+    p.add_argument('--since', default=FIRST_SEASON, help="First season, e.g. 0506")
+    p.add_argument('--league', action='append', dest='leagues',
+                   help="League code, e.g. E0 or ARG (repeatable, default: all)")
+    p.add_argument('--refresh', action='store_true',
+                   help="Rediscover the catalog and download every file again")
+    p.set_defaults(func=cmd_catalog)
+
+    p = subparsers.add_parser('sync', help="Add new matches of the current season")
+    p.set_defaults(func=cmd_sync)
+
+    p = subparsers.add_parser('freeze', help="Archive completed seasons as Parquet")
+    p.add_argument('--verify', action='store_true', help="Only verify archive checksums")
+    p.set_defaults(func=cmd_freeze)
+
+    p = subparsers.add_parser('rebuild', help="Rebuild football.db from data/*.csv")
+    p.add_argument('--db', default=DB_PATH)
+    p.add_argument('-y', '--yes', action='store_true', help="Overwrite without asking")
+    p.set_defaults(func=cmd_rebuild)
+
+    p = subparsers.add_parser('report', help="Run the DuckDB analysis reports")
+    p.add_argument('--output-dir',
+                   help="Also write reports.json and Parquet results to this directory")
+    p.set_defaults(func=cmd_report)
+
+    p = subparsers.add_parser('query', help="Run SQL or a canned query (interactive by default)")
+    p.add_argument('sql', nargs='?', help="SQL to run against all_matches")
+    p.add_argument('-i', '--interactive', action='store_true',
+                   help="Start an interactive SQL session (after running SQL, if given)")
+    p.add_argument('--season', default='2425')
+    p.add_argument('--table', metavar='LEAGUE', help="League table")
+    p.add_argument('--team', help="Season stats for a team")
+    p.add_argument('--form', metavar='TEAM', help="Recent form for a team")
+    p.add_argument('--h2h', nargs=2, metavar='TEAM', help="Head-to-head record")
+    p.set_defaults(func=cmd_query)
+
+    p = subparsers.add_parser('shell', help="Open the data in Harlequin")
+    p.set_defaults(func=cmd_shell)
+
+    p = subparsers.add_parser('simulate', help="Project final standings (Monte Carlo)")
+    p.add_argument('--season', default=CURRENT_SEASON)
+    p.add_argument('--league', action='append', dest='leagues', choices=LEAGUES,
+                   help="League code (repeatable, default: all)")
+    p.add_argument('--sims', type=int, default=100_000)
+    p.add_argument('--seed', type=int)
+    p.set_defaults(func=cmd_simulate)
+
+    p = subparsers.add_parser('fit', help="Fit the Poisson / Dixon-Coles goal model")
+    p.add_argument('--db', default=DB_PATH)
+    p.add_argument('--xi', type=float, default=0.0,
+                   help="Time-decay rate per day (default: 0, no decay)")
+    p.add_argument('--full', action='store_true', help="Refit every league-season")
+    p.set_defaults(func=cmd_fit)
+
+    p = subparsers.add_parser('store', help="Compare the compact match store's memory footprint")
+    p.add_argument('--db', default=DB_PATH)
+    p.set_defaults(func=cmd_store)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
@@ -0,0 +1,29 @@
+"""Leagues, seasons and default paths shared by the football modules"""
+from pathlib import Path
+
+# Define leagues and seasons
+LEAGUES = ['E0', 'E1', 'D1', 'D2', 'I1', 'I2', 'SP1', 'SP2', 'F1', 'F2']
+# LEAGUES = ['D1']
+SEASONS = ['2526', '2425', '2324', '2223', '2122', '2021', '1920', '1819', '1718']  # Add more as needed
+CURRENT_SEASON = '2526'  # Update this as needed
+# Completed seasons never change and can be frozen into the archive
+FROZEN_SEASONS = [s for s in SEASONS if s != CURRENT_SEASON]
+SITE_URL = "https://www.football-data.co.uk"
+BASE_URL = f"{SITE_URL}/mmz4281"
+# Oldest season the full-archive catalog goes back to
+FIRST_SEASON = '9394'
+
+
+def season_start_year(season):
+    """Calendar year a season code starts in ('9394' -> 1993, '2425' -> 2024)"""
+    yy = int(season[:2])
+    return 1900 + yy if yy >= 90 else 2000 + yy
+
+
+DATA_DIR = Path('data')
+ARCHIVE_DIR = Path('archive')
+# Full-archive downloads live apart from data/*.csv so the default views are unchanged
+CATALOG_DIR = DATA_DIR / 'catalog'
+# Upcoming fixtures of every league (https://www.football-data.co.uk/fixtures.csv)
+FIXTURES_PATH = DATA_DIR / 'fixtures' / 'fixtures.csv'
+DB_PATH = 'football.db'
@@ -0,0 +1,385 @@
+"""
+Poisson / Dixon-Coles goal model fitted per league-season.
+
+For each league-season the expected goals are
+
+    home: exp(mu + home + attack[home_team] - defence[away_team])
+    away: exp(mu + attack[away_team] - defence[home_team])
+
+with the Dixon-Coles rho correction for low scores. Matches are turned into
+sparse design matrices, several league-seasons are stacked block-diagonally
+and fitted in one L-BFGS run, and batches are spread over a process pool.
+Fits are stored in football.db (goal_model_fits / goal_model_teams) and
+warm-started from the previous fit when only a few matches were added.
+
+Usage:
+    football fit                     # fit new or changed league-seasons
+    football fit --full              # refit everything from scratch
+"""
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+from scipy import optimize, sparse
+
+from football.config import DB_PATH
+
+BATCH_SIZE = 8       # league-seasons per block-diagonal fit
+RIDGE = 1e-3         # small L2 penalty on team strengths (identifiability)
+RHO_GRID = np.linspace(-0.2, 0.2, 401)
+GRAD_TOL = 1e-4      # largest |gradient| per match for a league-season to count as converged
+
+
+def load_matches(db_path=DB_PATH):
+    """Load played matches from the matches table"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return pd.read_sql("""
+            SELECT League, Season, Date, HomeTeam, AwayTeam, FTHG, FTAG
+            FROM matches
+            WHERE FTHG IS NOT NULL AND FTAG IS NOT NULL
+              AND HomeTeam IS NOT NULL AND AwayTeam IS NOT NULL
+        """, conn)
+    finally:
+        conn.close()
+
+
+def load_fits(db_path=DB_PATH):
+    """
+    Load stored fits as
+    {(league, season): {'n_matches', 'goals_checksum', 'xi', 'teams', 'params'}}
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        tables = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if 'goal_model_fits' not in tables:
+            return {}
+        fits = pd.read_sql("SELECT * FROM goal_model_fits", conn)
+        teams = pd.read_sql("SELECT * FROM goal_model_teams ORDER BY League, Season, Team", conn)
+    finally:
+        conn.close()
+
+    stored = {}
+    team_groups = dict(iter(teams.groupby(['League', 'Season'])))
+    for fit in fits.itertuples():
+        group = team_groups.get((fit.League, fit.Season))
+        if group is None:
+            continue
+        stored[(fit.League, fit.Season)] = {
+            'n_matches': fit.n_matches,
+            # Fits stored before the checksum column existed are refitted once
+            'goals_checksum': getattr(fit, 'goals_checksum', None),
+            'xi': fit.xi,
+            'teams': list(group['Team']),
+            'params': np.concatenate([[fit.mu, fit.home], group['attack'], group['defence']]),
+        }
+    return stored
+
+
+def goals_checksum(group):
+    """Order-independent checksum of a league-season's fixtures and scores"""
+    rows = pd.DataFrame({
+        'Date': group['Date'].astype(str),
+        'HomeTeam': group['HomeTeam'].astype(str),
+        'AwayTeam': group['AwayTeam'].astype(str),
+        'FTHG': group['FTHG'].astype(float),
+        'FTAG': group['FTAG'].astype(float),
+    })
+    # Summing the row hashes (mod 2**64) ignores row order
+    return f"{int(pd.util.hash_pandas_object(rows, index=False).sum()):016x}"
+
+
+def design_matrix(home_idx, away_idx, n_teams):
+    """
+    Sparse design matrix for one league-season.
+
+    Rows are [home goals of every match, away goals of every match]; columns
+    are [mu, home, attack_0..attack_n-1, defence_0..defence_n-1].
+    """
+    n = len(home_idx)
+    rows = np.arange(2 * n)
+    home_rows, away_rows = rows[:n], rows[n:]
+
+    row_idx = np.concatenate([rows, home_rows, home_rows, home_rows, away_rows, away_rows])
+    col_idx = np.concatenate([
+        np.zeros(2 * n, dtype=int),          # mu
+        np.ones(n, dtype=int),               # home advantage
+        2 + home_idx,                        # home attack
+        2 + n_teams + away_idx,              # away defence
+        2 + away_idx,                        # away attack
+        2 + n_teams + home_idx,              # home defence
+    ])
+    values = np.concatenate([
+        np.ones(3 * n), np.ones(n), -np.ones(n), np.ones(n), -np.ones(n),
+    ])
+    return sparse.csr_matrix((values, (row_idx, col_idx)), shape=(2 * n, 2 + 2 * n_teams))
+
+
+def _poisson_objective(theta, X, y, w, penalty):
+    """Weighted Poisson negative log-likelihood and its gradient"""
+    eta = X @ theta
+    mu = np.exp(eta)
+    nll = np.dot(w, mu - y * eta) + np.dot(penalty, theta ** 2)
+    grad = X.T @ (w * (mu - y)) + 2 * penalty * theta
+    return nll, grad
+
+
+def _dixon_coles_rho(lam_home, lam_away, hg, ag, w, group, n_groups):
+    """Grid-search rho per group for the Dixon-Coles low-score correction"""
+    low = (hg <= 1) & (ag <= 1)
+    lh, la = lam_home[low, None], lam_away[low, None]
+    h, a, rho = hg[low, None], ag[low, None], RHO_GRID[None, :]
+
+    tau = np.select(
+        [(h == 0) & (a == 0), (h == 0) & (a == 1), (h == 1) & (a == 0)],
+        [1 - lh * la * rho, 1 + lh * rho, 1 + la * rho],
+        1 - rho)
+    loglik = w[low, None] * np.log(np.clip(tau, 1e-12, None))
+
+    # Sum over matches per group for every candidate rho
+    per_group = np.zeros((n_groups, len(RHO_GRID)))
+    np.add.at(per_group, group[low], loglik)
+    return RHO_GRID[per_group.argmax(axis=1)]
+
+
+def fit_batch(tasks, ridge=RIDGE):
+    """
+    Fit several league-seasons in one block-diagonal L-BFGS run.
+
+    Each task holds home_idx, away_idx, hg, ag, weights, n_teams and an
+    optional warm-start vector x0. The blocks share one optimiser run, so
+    each league-season's `converged` flag is judged from its own block of
+    the final gradient rather than from the run's overall status.
+    """
+    blocks, x0, penalty, sizes = [], [], [], []
+    for task in tasks:
+        n_teams = task['n_teams']
+        blocks.append(design_matrix(task['home_idx'], task['away_idx'], n_teams))
+        start = task.get('x0')
+        if start is None:
+            mean_goals = max(np.mean(np.concatenate([task['hg'], task['ag']])), 0.1)
+            start = np.concatenate([[np.log(mean_goals), 0.0], np.zeros(2 * n_teams)])
+        x0.append(start)
+        penalty.append(np.concatenate([[0.0, 0.0], np.full(2 * n_teams, ridge)]))
+        sizes.append(2 + 2 * n_teams)
+
+    X = sparse.block_diag(blocks, format='csr')
+    y = np.concatenate([np.concatenate([t['hg'], t['ag']]) for t in tasks])
+    w = np.concatenate([np.tile(t['weights'], 2) for t in tasks])
+
+    penalty = np.concatenate(penalty)
+    result = optimize.minimize(
+        _poisson_objective, np.concatenate(x0), args=(X, y, w, penalty),
+        jac=True, method='L-BFGS-B', options={'maxiter': 1000})
+    _, grad = _poisson_objective(result.x, X, y, w, penalty)
+    splits = np.cumsum(sizes)[:-1]
+
+    # Per-match rates for the rho step, split back into home/away halves
+    rates = np.exp(X @ result.x)
+    lam_home, lam_away, hg, ag, weights, group = [], [], [], [], [], []
+    offset = 0
+    for i, task in enumerate(tasks):
+        n = len(task['hg'])
+        lam_home.append(rates[offset:offset + n])
+        lam_away.append(rates[offset + n:offset + 2 * n])
+        hg.append(task['hg'])
+        ag.append(task['ag'])
+        weights.append(task['weights'])
+        group.append(np.full(n, i))
+        offset += 2 * n
+    rho = _dixon_coles_rho(*(np.concatenate(v) for v in (lam_home, lam_away, hg, ag, weights, group)),
+                           len(tasks))
+
+    fits = []
+    for i, (params, block_grad, task) in enumerate(
+            zip(np.split(result.x, splits), np.split(grad, splits), tasks)):
+        n_teams = task['n_teams']
+        n_matches = len(task['hg'])
+        fits.append({
+            'League': task['League'],
+            'Season': task['Season'],
+            'teams': task['teams'],
+            'n_matches': n_matches,
+            'goals_checksum': task['goals_checksum'],
+            'xi': task['xi'],
+            'mu': params[0],
+            'home': params[1],
+            'attack': params[2:2 + n_teams],
+            'defence': params[2 + n_teams:],
+            'rho': rho[i],
+            'converged': bool(np.abs(block_grad).max() <= GRAD_TOL * max(n_matches, 1)),
+        })
+    return fits
+
+
+def build_tasks(matches, stored=None, xi=0.0, full=False):
+    """
+    Turn the match table into fit tasks, skipping unchanged league-seasons.
+
+    xi is the Dixon-Coles time-decay rate per day (0 weights all matches
+    equally). A league-season is unchanged when its goals checksum and xi
+    match the stored fit; stored fits with the same teams are used as warm
+    starts.
+    """
+    stored = stored or {}
+    dates = pd.to_datetime(matches['Date'], errors='coerce')
+    tasks, skipped = [], 0
+
+    for (league, season), group in matches.groupby(['League', 'Season'], sort=True):
+        previous = stored.get((league, season))
+        checksum = goals_checksum(group)
+        if (not full and previous and previous['goals_checksum'] == checksum
+                and previous['xi'] == xi):
+            skipped += 1
+            continue
+
+        teams, codes = np.unique(
+            np.concatenate([group['HomeTeam'].to_numpy(), group['AwayTeam'].to_numpy()]),
+            return_inverse=True)
+        group_dates = dates.loc[group.index]
+        days_ago = (group_dates.max() - group_dates).dt.days.fillna(0).to_numpy()
+
+        task = {
+            'League': league,
+            'Season': season,
+            'teams': list(teams),
+            'n_teams': len(teams),
+            'home_idx': codes[:len(group)],
+            'away_idx': codes[len(group):],
+            'hg': group['FTHG'].to_numpy(dtype=float),
+            'ag': group['FTAG'].to_numpy(dtype=float),
+            'goals_checksum': checksum,
+            'xi': xi,
+            'weights': np.exp(-xi * days_ago),
+        }
+        if not full and previous and previous['teams'] == task['teams']:
+            task['x0'] = previous['params']
+        tasks.append(task)
+
+    return tasks, skipped
+
+
+def save_fits(fits, db_path=DB_PATH):
+    """Replace the stored parameters of the refitted league-seasons"""
+    fitted_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+    fit_rows = pd.DataFrame([{
+        'League': f['League'], 'Season': f['Season'], 'mu': f['mu'], 'home': f['home'],
+        'rho': f['rho'], 'xi': f['xi'], 'n_matches': f['n_matches'], 'n_teams': len(f['teams']),
+        'goals_checksum': f['goals_checksum'], 'fitted_at': fitted_at,
+    } for f in fits])
+    team_rows = pd.DataFrame({
+        'League': np.concatenate([[f['League']] * len(f['teams']) for f in fits]),
+        'Season': np.concatenate([[f['Season']] * len(f['teams']) for f in fits]),
+        'Team': np.concatenate([f['teams'] for f in fits]),
+        'attack': np.concatenate([f['attack'] for f in fits]),
+        'defence': np.concatenate([f['defence'] for f in fits]),
+    })
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS goal_model_fits (
+                League TEXT, Season TEXT, mu REAL, home REAL, rho REAL, xi REAL,
+                n_matches INTEGER, n_teams INTEGER, goals_checksum TEXT, fitted_at TEXT,
+                PRIMARY KEY (League, Season))
+        """)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(goal_model_fits)")}
+        if 'goals_checksum' not in columns:
+            conn.execute("ALTER TABLE goal_model_fits ADD COLUMN goals_checksum TEXT")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS goal_model_teams (
+                League TEXT, Season TEXT, Team TEXT, attack REAL, defence REAL,
+                PRIMARY KEY (League, Season, Team))
+        """)
+        keys = list(zip(fit_rows['League'], fit_rows['Season']))
+        conn.executemany("DELETE FROM goal_model_fits WHERE League = ? AND Season = ?", keys)
+        conn.executemany("DELETE FROM goal_model_teams WHERE League = ? AND Season = ?", keys)
+        fit_rows.to_sql('goal_model_fits', conn, if_exists='append', index=False)
+        team_rows.to_sql('goal_model_teams', conn, if_exists='append', index=False)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def fit_all(db_path=DB_PATH, xi=0.0, full=False, workers=None, batch_size=BATCH_SIZE):
+    """Fit every new or changed league-season and store the parameters"""
+    start = time.perf_counter()
+    matches = load_matches(db_path)
+    tasks, skipped = build_tasks(matches, None if full else load_fits(db_path), xi, full)
+
+    if not tasks:
+        print(f"✓ Goal model up to date ({skipped} league-seasons unchanged)")
+        return []
+
+    batches = [tasks[i:i + batch_size] for i in range(0, len(tasks), batch_size)]
+    workers = workers or min(len(batches), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        fits = [fit for batch in pool.map(fit_batch, batches) for fit in batch]
+
+    save_fits(fits, db_path)
+
+    warm = sum('x0' in task for task in tasks)
+    print(f"✓ Fitted {len(fits)} league-seasons ({warm} warm-started, {skipped} unchanged) "
+          f"in {time.perf_counter() - start:.1f}s")
+    not_converged = [f"{f['League']}/{f['Season']}" for f in fits if not f['converged']]
+    if not_converged:
+        print(f"✗ Did not converge: {', '.join(not_converged)}")
+    return fits
+
+
+def load_params(league, season, db_path=DB_PATH):
+    """Look up a fitted league-season: (mu, home, rho, {team: (attack, defence)})"""
+    conn = sqlite3.connect(db_path)
+    try:
+        fit = conn.execute("""
+            SELECT mu, home, rho FROM goal_model_fits
+            WHERE League = ? AND Season = ?
+        """, [league, season]).fetchone()
+        if fit is None:
+            raise KeyError(f"No goal model fit for {league}/{season}")
+        teams = conn.execute("""
+            SELECT Team, attack, defence FROM goal_model_teams
+            WHERE League = ? AND Season = ?
+        """, [league, season]).fetchall()
+    finally:
+        conn.close()
+    mu, home, rho = fit
+    return mu, home, rho, {team: (attack, defence) for team, attack, defence in teams}
+
+
+def score_matrix(lam_home, lam_away, rho, max_goals=10):
+    """Scoreline probabilities P(home = i, away = j) with the Dixon-Coles correction"""
+    goals = np.arange(max_goals + 1)
+    log_fact = np.cumsum(np.log(np.maximum(goals, 1)))
+    p_home = np.exp(goals * np.log(lam_home) - lam_home - log_fact)
+    p_away = np.exp(goals * np.log(lam_away) - lam_away - log_fact)
+    matrix = np.outer(p_home, p_away)
+    matrix[0, 0] *= 1 - lam_home * lam_away * rho
+    matrix[0, 1] *= 1 + lam_home * rho
+    matrix[1, 0] *= 1 + lam_away * rho
+    matrix[1, 1] *= 1 - rho
+    return matrix
+
+
+def match_probabilities(home_team, away_team, league, season, db_path=DB_PATH):
+    """Home win / draw / away win probabilities and expected goals for a fixture"""
+    mu, home, rho, teams = load_params(league, season, db_path)
+    home_attack, home_defence = teams[home_team]
+    away_attack, away_defence = teams[away_team]
+
+    lam_home = np.exp(mu + home + home_attack - away_defence)
+    lam_away = np.exp(mu + away_attack - home_defence)
+    matrix = score_matrix(lam_home, lam_away, rho)
+
+    return {
+        'home_win': float(np.tril(matrix, -1).sum()),
+        'draw': float(np.trace(matrix)),
+        'away_win': float(np.triu(matrix, 1).sum()),
+        'home_xg': float(lam_home),
+        'away_xg': float(lam_away),
+    }
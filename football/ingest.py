@@ -0,0 +1,366 @@
+"""Download football-data.co.uk CSV files and build the football.db SQLite database"""
+import pandas as pd
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+import time
+
+from football import archive, validation
+from football.config import (LEAGUES, SEASONS, CURRENT_SEASON, FROZEN_SEASONS, SITE_URL,
+                             BASE_URL, DATA_DIR, FIXTURES_PATH, DB_PATH)
+
+def download_csv(season, league, data_dir=DATA_DIR):
+    """Download a single CSV file"""
+    url = f"{BASE_URL}/{season}/{league}.csv"
+    output_dir = Path(data_dir)
+    output_dir.mkdir(exist_ok=True)
+    
+    filepath = output_dir / f"{season}_{league}.csv"
+
+    # Imported here so that building the database does not pay for requests
+    import requests
+
+    try:
+        response = requests.get(url, timeout=10)
+        response.raise_for_status()
+        
+        with open(filepath, 'wb') as f:
+            f.write(response.content)
+        
+        print(f"✓ Downloaded {season}/{league}")
+        return filepath
+    except requests.exceptions.RequestException as e:
+        print(f"✗ Failed {season}/{league}: {e}")
+        return None
+
+def download_fixtures(filepath=FIXTURES_PATH):
+    """Download the upcoming fixtures of every league"""
+    import requests
+
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        response = requests.get(f"{SITE_URL}/fixtures.csv", timeout=10)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        print(f"✗ Failed fixtures: {e}")
+        return None
+
+    filepath.write_bytes(response.content)
+    print("✓ Downloaded fixtures")
+    return filepath
+
+def download_all(seasons, leagues):
+    """Download all CSV files"""
+    files = []
+    for season in seasons:
+        for league in leagues:
+            filepath = download_csv(season, league)
+            if filepath:
+                files.append(filepath)
+            time.sleep(0.5)  # Be nice to the server
+    return files
+
+def inspect_schemas(filepaths):
+    """Check all CSV schemas and find common columns"""
+    all_columns = {}
+    
+    for filepath in filepaths:
+        try:
+            df = pd.read_csv(filepath, nrows=1)
+            columns = set(df.columns)
+            all_columns[filepath.name] = columns
+            print(f"{filepath.name}: {len(columns)} columns")
+        except Exception as e:
+            print(f"Error reading {filepath.name}: {e}")
+    
+    # Find common columns
+    if all_columns:
+        common_cols = set.intersection(*all_columns.values())
+        all_cols = set.union(*all_columns.values())
+        
+        print(f"\nCommon columns: {len(common_cols)}")
+        print(f"All unique columns: {len(all_cols)}")
+        print(f"\nColumns not in all files: {all_cols - common_cols}")
+        
+        return common_cols, all_cols
+    return set(), set()
+
+# Old and extra-league column names -> the canonical names of the current main-league files
+COLUMN_ALIASES = {
+    'HT': 'HomeTeam', 'AT': 'AwayTeam', 'Home': 'HomeTeam', 'Away': 'AwayTeam',
+    'HG': 'FTHG', 'AG': 'FTAG', 'Res': 'FTR',
+    # Extra leagues label Pinnacle prices PH/PD/PA
+    'PH': 'PSH', 'PD': 'PSD', 'PA': 'PSA',
+    # Betbrain market max/average, renamed Max*/Avg* from 2019/20
+    'BbMxH': 'MaxH', 'BbMxD': 'MaxD', 'BbMxA': 'MaxA',
+    'BbAvH': 'AvgH', 'BbAvD': 'AvgD', 'BbAvA': 'AvgA',
+    'BbMx>2.5': 'Max>2.5', 'BbMx<2.5': 'Max<2.5',
+    'BbAv>2.5': 'Avg>2.5', 'BbAv<2.5': 'Avg<2.5',
+    'BbAHh': 'AHh', 'BbMxAHH': 'MaxAHH', 'BbMxAHA': 'MaxAHA',
+    'BbAvAHH': 'AvgAHH', 'BbAvAHA': 'AvgAHA',
+}
+
+def read_football_csv(filepath):
+    """Read a football-data CSV, tolerating latin-1 files and trailing commas"""
+    for encoding in ('utf-8-sig', 'latin-1'):
+        try:
+            header = pd.read_csv(filepath, encoding=encoding, nrows=0).columns
+            # Old files pad rows with extra commas; only read the header's columns
+            return pd.read_csv(filepath, encoding=encoding, usecols=range(len(header)))
+        except UnicodeDecodeError:
+            continue
+
+def normalise_columns(df):
+    """Map old and extra-league column names onto the canonical schema"""
+    df.columns = df.columns.str.strip()
+    df = df.drop(columns=[c for c in df.columns if c.startswith('Unnamed:') or c == ''])
+    renames = {old: new for old, new in COLUMN_ALIASES.items()
+               if old in df.columns and new not in df.columns}
+    df = df.rename(columns=renames)
+    # SQLite column names are case-insensitive
+    duplicated = df.columns.str.lower().duplicated()
+    if duplicated.any():
+        df = df.iloc[:, ~duplicated]
+    # Old files end with blank padding rows
+    if 'HomeTeam' in df.columns and 'AwayTeam' in df.columns:
+        df = df.dropna(subset=['HomeTeam', 'AwayTeam'], how='all')
+    return df
+
+def iso_dates(df):
+    """Convert the Date column to ISO strings (from dd/mm/yyyy or dd/mm/yy)"""
+    if 'Date' in df.columns:
+        # Explicit formats keep parsing vectorised (no per-row dateutil fallback)
+        dates = pd.to_datetime(df['Date'], format='%d/%m/%Y', errors='coerce')
+        short = dates.isna() & df['Date'].notna()
+        if short.any():
+            # Files before 2017/18 (and some after) use two-digit years
+            dates[short] = pd.to_datetime(df.loc[short, 'Date'], format='%d/%m/%y',
+                                          errors='coerce')
+        df['Date'] = dates
+        # Convert to string in ISO format (YYYY-MM-DD) for SQLite compatibility
+        df['Date'] = df['Date'].dt.strftime('%Y-%m-%d')
+    return df
+
+def load_csv_with_metadata(filepath):
+    """Load CSV and add season/league metadata"""
+    df = normalise_columns(read_football_csv(filepath))
+    df = iso_dates(df)
+
+    # Extract season and league from filename
+    parts = filepath.stem.split('_')
+    df['Season'] = parts[0]
+    df['League'] = parts[1]
+    df['Source_File'] = filepath.name
+
+    return df
+def table_exists(conn, table):
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table,)).fetchone() is not None
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+def ensure_columns(conn, df, table='matches'):
+    """Add the frame's columns that the table does not have yet"""
+    existing = {row[1].lower() for row in conn.execute(f"PRAGMA table_info({table})")}
+    if not existing:
+        return  # to_sql creates the table
+    for column, dtype in df.dtypes.items():
+        if column.lower() not in existing:
+            sql_type = 'REAL' if dtype.kind in 'biuf' else 'TEXT'
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {_quote(column)} {sql_type}")
+
+def store_quality(conn, quarantined, metrics):
+    """Replace the files' quarantined rows and quality metrics"""
+    metrics = metrics.assign(Validated_At=datetime.now().isoformat(timespec='seconds'))
+    sources = [(source,) for source in metrics['Source_File']]
+    for table, df in ((validation.QUARANTINE_TABLE, quarantined),
+                      (validation.METRICS_TABLE, metrics)):
+        if table_exists(conn, table):
+            conn.executemany(f"DELETE FROM {table} WHERE Source_File = ?", sources)
+            ensure_columns(conn, df, table)
+        df.to_sql(table, conn, if_exists='append', index=False)
+    validation.print_metrics(metrics)
+
+def create_database(filepaths, db_path=DB_PATH, use_common_cols=False,
+                    archive_dir=archive.ARCHIVE_DIR):
+    """Create SQLite database from CSV files, reading frozen seasons from the archive"""
+    conn = sqlite3.connect(db_path)
+    
+    all_dfs, clean_dfs, archived_quality = [], [], []
+    frozen = archive.archived_seasons(archive_dir)
+    for season in sorted(frozen):
+        df = archive.read_season(season, archive_dir)
+        quality = archive.read_quality(season, archive_dir)
+        if quality is None:
+            # Frozen before its quarantine was archived: check the stored rows again
+            all_dfs.append(df)
+        else:
+            clean_dfs.append(df)
+            archived_quality.append(quality)
+    if frozen:
+        print(f"Loaded {len(frozen)} frozen seasons from {archive_dir}")
+
+    for filepath in filepaths:
+        if archive.season_of(filepath) in frozen:
+            continue
+        try:
+            df = load_csv_with_metadata(filepath)
+            all_dfs.append(df)
+        except Exception as e:
+            print(f"Error loading {filepath}: {e}")
+    
+    if not all_dfs and not clean_dfs:
+        print("No data to import")
+        return
+
+    # Keep bad rows out of matches (the whole table is rebuilt, so is the quarantine)
+    for table in (validation.QUARANTINE_TABLE, validation.METRICS_TABLE):
+        conn.execute(f"DROP TABLE IF EXISTS {table}")
+    # Frozen seasons restore the rows quarantined when they were frozen
+    for quarantined, metrics in archived_quality:
+        store_quality(conn, quarantined, metrics)
+    for df in all_dfs:
+        clean, quarantined, metrics = validation.validate(df)
+        store_quality(conn, quarantined, metrics)
+        clean_dfs.append(clean)
+
+    # Combine all dataframes
+    combined_df = pd.concat(clean_dfs, ignore_index=True, sort=False)
+    
+    # Clean column names (remove spaces, special chars)
+    combined_df.columns = combined_df.columns.str.strip()
+    
+    # Create table
+    combined_df.to_sql('matches', conn, if_exists='replace', index=False)
+    
+    # Create indexes for better query performance
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_date ON matches(Date)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_league ON matches(League)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_season ON matches(Season)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_teams ON matches(HomeTeam, AwayTeam)')
+    
+    conn.commit()
+    conn.close()
+    
+    print(f"\n✓ Database created: {db_path}")
+    print(f"  Total rows: {len(combined_df)}")
+    print(f"  Columns: {len(combined_df.columns)}")
+def update_database(new_csv_path, db_path=DB_PATH):
+    """Add only new rows from a CSV to the database"""
+    conn = sqlite3.connect(db_path)
+    
+    # Load new data
+    new_df = load_csv_with_metadata(Path(new_csv_path))
+    new_df.columns = new_df.columns.str.strip()
+    new_df, quarantined, metrics = validation.validate(new_df)
+    store_quality(conn, quarantined, metrics)
+    if new_df.empty:
+        print("No valid rows to add")
+        conn.commit()
+        conn.close()
+        return
+    
+    # Get existing data for this season/league
+    season = new_df['Season'].iloc[0]
+    league = new_df['League'].iloc[0]
+    
+    query = f"""
+    SELECT * FROM matches 
+    WHERE Season = '{season}' AND League = '{league}'
+    """
+    existing_df = pd.read_sql(query, conn)
+    
+    if len(existing_df) == 0:
+        # No existing data, insert all
+        new_df.to_sql('matches', conn, if_exists='append', index=False)
+        print(f"Added {len(new_df)} new rows")
+    else:
+        # Find rows that don't exist yet
+        # Create a unique key from match details
+        def make_key(df):
+            return df['Date'].astype(str) + '_' + df['HomeTeam'] + '_' + df['AwayTeam']
+        
+        existing_keys = set(make_key(existing_df))
+        new_df['_key'] = make_key(new_df)
+        
+        new_rows = new_df[~new_df['_key'].isin(existing_keys)]
+        new_rows = new_rows.drop('_key', axis=1)
+        
+        if len(new_rows) > 0:
+            new_rows.to_sql('matches', conn, if_exists='append', index=False)
+            print(f"Added {len(new_rows)} new rows out of {len(new_df)} total")
+        else:
+            print("No new rows to add")
+    
+    conn.commit()
+    conn.close()
+
+def sync_latest(db_path=DB_PATH):
+    """Download and update with latest data for current season"""
+    for league in LEAGUES:
+        print(f"Syncing {league}...")
+        filepath = download_csv(CURRENT_SEASON, league, data_dir='temp')
+        if filepath:
+            update_database(filepath, db_path)
+            filepath.unlink()  # Clean up temp file
+    # Upcoming fixtures give the simulator the teams that have not played yet
+    download_fixtures()
+
+
+def freeze_seasons(seasons=FROZEN_SEASONS, data_dir=DATA_DIR, archive_dir=archive.ARCHIVE_DIR):
+    """Store completed seasons once in the archive tier"""
+    for season in seasons:
+        if season == CURRENT_SEASON:
+            print(f"✗ Refusing to freeze the open season {season}")
+            continue
+
+        filepaths = sorted(Path(data_dir).glob(f"{season}_*.csv"))
+        if not filepaths:
+            print(f"✗ No CSV files for {season}")
+            continue
+        if archive.sources_unchanged(season, filepaths, archive_dir):
+            print(f"✓ {season} already archived")
+            continue
+
+        df = pd.concat([load_csv_with_metadata(p) for p in filepaths],
+                       ignore_index=True, sort=False)
+        df.columns = df.columns.str.strip()
+        # Only valid rows are frozen, so the archived aggregates leave out bad rows too
+        df, quarantined, metrics = validation.validate(df)
+        validation.print_metrics(metrics)
+        archive.write_season(df, season, filepaths, archive_dir, quarantined, metrics)
+
+def main():
+    # Initial setup
+    print("=== Downloading CSVs ===")
+    # Frozen seasons are already in the archive and never change
+    frozen = archive.archived_seasons()
+    files = download_all([s for s in SEASONS if s not in frozen], LEAGUES)
+    
+    print("\n=== Inspecting Schemas ===")
+    common_cols, all_cols = inspect_schemas(files)
+
+    print("\n=== Freezing Completed Seasons ===")
+    freeze_seasons()
+    
+    print("\n=== Creating Database ===")
+    create_database(files)
+    
+    print("\n=== Database ready! ===")
+
+def update():
+    """Run this periodically to get new matches"""
+    print("=== Updating Database ===")
+    sync_latest()
+
+    print("\n=== Refitting Goal Model ===")
+    # Only the league-seasons that gained matches are refitted (warm-started)
+    from football import goal_model
+    goal_model.fit_all()
+
+def freeze():
+    """Run this once a season has finished"""
+    print("=== Freezing Completed Seasons ===")
+    freeze_seasons()
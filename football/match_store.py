@@ -0,0 +1,169 @@
+"""
+Compact in-memory match store.
+
+pd.read_sql('matches') and load_csv_with_metadata() keep every team, league,
+referee and file name as a Python string and every odds column as float64.
+This module loads the same data with categorical strings, real datetimes and
+downcast numeric columns, and only reads the column groups a caller needs:
+
+    results  Date, teams, goals and results (always loaded)
+    stats    Referee, shots, corners, fouls, cards
+    odds     everything else (bookmaker prices and handicap lines)
+
+load_matches() reads the matches table this way; compact_frame() converts
+an existing DataFrame such as the output of load_csv_with_metadata().
+
+Usage:
+    football store                   # memory footprint vs. the plain DataFrame
+"""
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from football.config import DB_PATH
+
+KEY_COLUMNS = ['Season', 'League', 'Date', 'HomeTeam', 'AwayTeam']
+RESULT_COLUMNS = KEY_COLUMNS + [
+    'Div', 'Time', 'FTHG', 'FTAG', 'FTR', 'HTHG', 'HTAG', 'HTR', 'Source_File',
+]
+STATS_COLUMNS = [
+    'Referee', 'Attendance', 'HS', 'AS', 'HST', 'AST', 'HHW', 'AHW', 'HC', 'AC',
+    'HF', 'AF', 'HFKC', 'AFKC', 'HO', 'AO', 'HY', 'AY', 'HR', 'AR', 'HBP', 'ABP',
+]
+GROUPS = ('results', 'stats', 'odds')
+
+# String columns with few distinct values
+CATEGORICAL_COLUMNS = {
+    'Div', 'Season', 'League', 'HomeTeam', 'AwayTeam', 'FTR', 'HTR',
+    'Referee', 'Source_File', 'Time',
+}
+
+
+def column_group(column):
+    """Column group ('results', 'stats' or 'odds') of a matches column"""
+    if column in RESULT_COLUMNS:
+        return 'results'
+    if column in STATS_COLUMNS:
+        return 'stats'
+    return 'odds'
+
+
+def select_columns(columns, groups=('results',)):
+    """Columns belonging to the requested groups (plus the key columns), in table order"""
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        raise ValueError(f"Unknown column groups: {', '.join(sorted(unknown))}")
+    return [c for c in columns if c in KEY_COLUMNS or column_group(c) in groups]
+
+
+def _compact_numeric(series):
+    """Downcast a numeric column: small counts to (nullable) uint8, floats to float32"""
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    present = values[~np.isnan(values)]
+
+    if len(present) and np.all(present == np.round(present)) \
+            and present.min() >= 0 and present.max() < 256:
+        return series.astype('UInt8' if len(present) < len(values) else np.uint8)
+    if len(present) and np.all(present == np.round(present)):
+        return pd.to_numeric(series, downcast='integer') if len(present) == len(values) \
+            else series.astype('Int32')
+    return series.astype(np.float32)
+
+
+def compact_frame(df, groups=None):
+    """
+    Return a compact copy of a matches DataFrame.
+
+    groups restricts the columns to the given column groups (default: all).
+    Date becomes datetime64; strings become categoricals.
+    """
+    if groups is not None:
+        df = df[select_columns(df.columns, groups)]
+
+    # Home and away teams share one set of categories so they stay comparable
+    teams = [c for c in ('HomeTeam', 'AwayTeam') if c in df.columns]
+    team_dtype = pd.CategoricalDtype(
+        pd.unique(pd.concat([df[c] for c in teams]).dropna())) if teams else None
+
+    compact = {}
+    for column in df.columns:
+        series = df[column]
+        if column == 'Date':
+            compact[column] = pd.to_datetime(series, errors='coerce')
+        elif column in teams:
+            compact[column] = series.astype(team_dtype)
+        elif column in CATEGORICAL_COLUMNS:
+            compact[column] = series.astype('category')
+        elif pd.api.types.is_numeric_dtype(series):
+            compact[column] = _compact_numeric(series)
+        else:
+            numeric = pd.to_numeric(series, errors='coerce')
+            if numeric.notna().sum() == series.notna().sum():
+                # Numbers stored as text (e.g. odds columns read from SQLite as TEXT)
+                compact[column] = _compact_numeric(numeric)
+            else:
+                compact[column] = series.astype('category')
+    return pd.DataFrame(compact, index=df.index)
+
+
+def table_columns(conn, table='matches'):
+    """Column names of a SQLite table, in table order"""
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def load_matches(db_path=DB_PATH, groups=('results',), leagues=None, seasons=None):
+    """
+    Load the matches table in compact form.
+
+    Only the requested column groups are read from SQLite, optionally
+    restricted to some leagues and seasons.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        columns = select_columns(table_columns(conn), groups)
+        query = f"SELECT {', '.join(f'[{c}]' for c in columns)} FROM matches"
+
+        conditions, params = [], []
+        if leagues:
+            conditions.append(f"League IN ({', '.join('?' for _ in leagues)})")
+            params += list(leagues)
+        if seasons:
+            conditions.append(f"Season IN ({', '.join('?' for _ in seasons)})")
+            params += list(seasons)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        df = pd.read_sql(query, conn, params=params)
+    finally:
+        conn.close()
+    return compact_frame(df)
+
+
+def memory_mb(df):
+    """Deep memory usage of a DataFrame in MB"""
+    return df.memory_usage(deep=True).sum() / 1024 / 1024
+
+
+def memory_report(db_path=DB_PATH):
+    """Compare the compact store against pd.read_sql of the full matches table"""
+    print("\n=== Match Store Memory Footprint ===")
+
+    conn = sqlite3.connect(db_path)
+    try:
+        full = pd.read_sql("SELECT * FROM matches", conn)
+    finally:
+        conn.close()
+    baseline = memory_mb(full)
+    print(f"pd.read_sql (all columns): {baseline:8.1f} MB  "
+          f"({len(full):,} rows × {len(full.columns)} columns)")
+
+    compact_all = compact_frame(full)
+    print(f"Compact (all columns):     {memory_mb(compact_all):8.1f} MB  "
+          f"({baseline / memory_mb(compact_all):.1f}× smaller)")
+
+    for groups in [('results',), ('results', 'stats'), ('results', 'odds')]:
+        df = load_matches(db_path, groups)
+        size = memory_mb(df)
+        print(f"Compact ({' + '.join(groups)}):".ljust(27) +
+              f"{size:8.1f} MB  ({len(df.columns)} columns)")
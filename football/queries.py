@@ -1,26 +1,26 @@
+"""Team, head-to-head, form, league table and betting queries over all matches"""
 import duckdb
-from pathlib import Path
-
-# Initialize DuckDB connection
-con = duckdb.connect()
-
-# Create view of all matches
-con.execute("""
-    CREATE OR REPLACE VIEW all_matches AS
-    SELECT
-        *,
-        CAST(SUBSTRING(regexp_replace(filename, '.*/(\d{4})_.*', '\\1'), 1, 2) ||
-             SUBSTRING(regexp_replace(filename, '.*/(\d{4})_.*', '\\1'), 3, 4) AS VARCHAR) as Season,
-        regexp_replace(filename, '.*_([A-Z0-9]+)\.csv', '\\1') as League
-    FROM read_csv_auto('data/*.csv', filename=true, ignore_errors=true)
-""")
+
+from football import archive
+
+# DuckDB connection with the all_matches view, created on first use
+_con = None
+
+def connection():
+    """Return the DuckDB connection, creating the all_matches view on first use"""
+    global _con
+    if _con is None:
+        _con = duckdb.connect()
+        # Frozen seasons come from the archive
+        archive.create_views(_con)
+    return _con
 
 def team_season_stats(team_name, season='2425'):
     """Get comprehensive stats for a team in a season"""
     print(f"\n=== {team_name} - Season {season} ===")
 
     # Home record
-    home = con.execute("""
+    home = connection().execute("""
         SELECT
             COUNT(*) as games,
             SUM(CASE WHEN FTR = 'H' THEN 1 ELSE 0 END) as wins,
@@ -33,7 +33,7 @@ def team_season_stats(team_name, season='2425'):
     """, [team_name, season]).fetchone()
 
     # Away record
-    away = con.execute("""
+    away = connection().execute("""
         SELECT
             COUNT(*) as games,
             SUM(CASE WHEN FTR = 'A' THEN 1 ELSE 0 END) as wins,
@@ -65,7 +65,7 @@ def head_to_head(team1, team2, limit=10):
     """Get head-to-head record between two teams"""
     print(f"\n=== {team1} vs {team2} (Last {limit} matches) ===")
 
-    results = con.execute("""
+    results = connection().execute("""
         SELECT
             Date,
             Season,
@@ -127,7 +127,7 @@ def form_guide(team_name, n=5, season='2425'):
     """Show recent form for a team"""
     print(f"\n=== {team_name} - Last {n} Matches (Season {season}) ===")
 
-    results = con.execute("""
+    results = connection().execute("""
         SELECT
             Date,
             League,
@@ -187,7 +187,7 @@ def league_table(league='E0', season='2425'):
     print(f"\n=== {league} Table - Season {season} ===")
 
     # This is a simplified table - doesn't handle all edge cases
-    result = con.execute("""
+    result = connection().execute("""
         WITH home_stats AS (
             SELECT
                 HomeTeam as team,
@@ -243,7 +243,7 @@ def betting_analysis(league='E0', season='2425'):
     """Analyze betting trends"""
     print(f"\n=== Betting Analysis: {league} - Season {season} ===")
 
-    result = con.execute("""
+    result = connection().execute("""
         SELECT
             COUNT(*) as total_matches,
             ROUND(100.0 * SUM(CASE WHEN FTR = 'H' THEN 1 ELSE 0 END) / COUNT(*), 1) as home_win_pct,
@@ -268,8 +268,9 @@ def betting_analysis(league='E0', season='2425'):
         print(f"  Under 2.5: {under_pct}%")
         print(f"  Both teams to score: {btts_pct}%")
 
-# Example usage
-if __name__ == '__main__':
+def main():
+    """Example usage"""
+    global _con
     # Uncomment the analyses you want to run
 
     # Team stats
@@ -289,4 +290,5 @@ if __name__ == '__main__':
     betting_analysis('E0', '2425')
     betting_analysis('SP1', '2425')
 
-    con.close()
+    connection().close()
+    _con = None
@@ -1,35 +1,28 @@
-#!/usr/bin/env python3
 """
 Rebuild the football.db database with properly formatted dates (YYYY-MM-DD)
 """
 import os
-import sys
 from pathlib import Path
 
-# Import from import-requests.py
-sys.path.insert(0, str(Path(__file__).parent))
-import importlib.util
-spec = importlib.util.spec_from_file_location("import_requests", "import-requests.py")
-import_requests = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(import_requests)
-create_database = import_requests.create_database
+from football.config import DATA_DIR, DB_PATH
+from football.ingest import create_database
 
-def main():
+def main(db_path=DB_PATH, assume_yes=False):
     # Check if database exists
-    db_path = 'football.db'
-    if os.path.exists(db_path):
+    if os.path.exists(db_path) and not assume_yes:
         response = input(f"⚠️  {db_path} already exists. Overwrite? (yes/no): ")
         if response.lower() not in ['yes', 'y']:
             print("Cancelled.")
             return
 
+    if os.path.exists(db_path):
         # Backup the old database
-        backup_path = 'football.db.backup'
+        backup_path = f"{db_path}.backup"
         os.rename(db_path, backup_path)
         print(f"✓ Backed up existing database to {backup_path}")
 
     # Find all CSV files
-    data_dir = Path('data')
+    data_dir = Path(DATA_DIR)
     csv_files = sorted(data_dir.glob('*.csv'))
 
     if not csv_files:
@@ -49,6 +42,3 @@ def main():
     print("\nDate format changed from dd/mm/yyyy to YYYY-MM-DD")
     print("You can now query dates properly:")
     print("  SELECT * FROM matches WHERE Date >= '2024-01-01' ORDER BY Date DESC")
-
-if __name__ == '__main__':
-    main()
@@ -0,0 +1,330 @@
+"""
+Monte Carlo season simulator for projected final standings.
+
+Takes the current standings and the remaining fixtures of each league,
+samples the remaining scorelines from a Poisson strength model fitted on
+the season's results and the previous seasons' (weighted down per season
+back), and counts how often each team finishes in each position. Tables
+are ranked like league_table: points, goal difference, goals for.
+
+Usage:
+    football simulate                     # all leagues, current season
+    football simulate --league E0 --sims 200000
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+from football import archive, ingest
+from football.config import CURRENT_SEASON, DATA_DIR, FIXTURES_PATH, LEAGUES, season_start_year
+
+N_SIMS = 100_000
+CHUNK_SIZE = 10_000  # simulations per batch, bounds memory per league
+PRIOR_GAMES = 5      # shrink team strengths towards the league average
+HISTORY_SEASONS = 2  # previous seasons the strengths are fitted on
+HISTORY_DECAY = 0.5  # weight of a match per season back
+
+# Direct relegation places (play-off places are not counted)
+RELEGATION_PLACES = {
+    'E0': 3, 'E1': 3, 'D1': 2, 'D2': 2, 'I1': 3,
+    'I2': 3, 'SP1': 3, 'SP2': 4, 'F1': 2, 'F2': 2,
+}
+
+
+def previous_seasons(season, n=HISTORY_SEASONS):
+    """Season codes before `season` ('2526' -> ['2425', '2324'])"""
+    start = int(season[:2])
+    return [f"{(start - k) % 100:02d}{(start - k + 1) % 100:02d}" for k in range(1, n + 1)]
+
+
+def load_results(season=CURRENT_SEASON, leagues=LEAGUES, data_dir=DATA_DIR,
+                 history=HISTORY_SEASONS):
+    """Load played matches of a season and the previous `history` seasons, grouped by league"""
+    seasons = [season] + previous_seasons(season, history)
+    con = duckdb.connect()
+    try:
+        archive.create_views(con, data_dir)
+        df = con.execute(f"""
+            SELECT Season, League, HomeTeam, AwayTeam, FTHG, FTAG
+            FROM all_matches
+            WHERE Season IN ({', '.join('?' for _ in seasons)})
+              AND League IN ({', '.join('?' for _ in leagues)})
+              AND FTHG IS NOT NULL AND FTAG IS NOT NULL
+        """, [*seasons, *leagues]).df()
+    finally:
+        con.close()
+    return {league: group for league, group in df.groupby('League')}
+
+
+def load_fixture_teams(season=CURRENT_SEASON, leagues=LEAGUES, path=FIXTURES_PATH):
+    """Teams with upcoming fixtures in the season, by league (empty without a fixtures file)"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    fixtures = ingest.iso_dates(ingest.normalise_columns(ingest.read_football_csv(path)))
+
+    # A fixtures file left over from last season must not add its teams
+    year = season_start_year(season)
+    in_season = (fixtures['Date'] >= f"{year}-07-01") & (fixtures['Date'] < f"{year + 1}-07-01")
+    fixtures = fixtures[in_season & fixtures['Div'].isin(leagues)]
+    return {league: set(group['HomeTeam']) | set(group['AwayTeam'])
+            for league, group in fixtures.groupby('Div')}
+
+
+def fit_strengths(n_teams, home_idx, away_idx, hg, ag, weights=None,
+                  prior_attack=1.0, prior_defence=1.0, prior_games=PRIOR_GAMES):
+    """
+    Fit multiplicative attack/defence strengths from goals scored and conceded.
+
+    Each match counts with its weight; strengths are shrunk towards the
+    priors (the league average by default). Returns (attack, defence,
+    home_rate, away_rate) so that the expected home goals are
+    home_rate * attack[home] * defence[away].
+    """
+    if len(hg) == 0:
+        return (np.ones(n_teams) * prior_attack, np.ones(n_teams) * prior_defence, 1.5, 1.2)
+    if weights is None:
+        weights = np.ones(len(hg))
+
+    games = (np.bincount(home_idx, weights=weights, minlength=n_teams) +
+             np.bincount(away_idx, weights=weights, minlength=n_teams))
+    gf = (np.bincount(home_idx, weights=weights * hg, minlength=n_teams) +
+          np.bincount(away_idx, weights=weights * ag, minlength=n_teams))
+    ga = (np.bincount(home_idx, weights=weights * ag, minlength=n_teams) +
+          np.bincount(away_idx, weights=weights * hg, minlength=n_teams))
+
+    home_rate = np.average(hg, weights=weights)
+    away_rate = np.average(ag, weights=weights)
+    mean_goals = (home_rate + away_rate) / 2
+    attack = (gf + prior_games * mean_goals * prior_attack) / (games + prior_games) / mean_goals
+    defence = (ga + prior_games * mean_goals * prior_defence) / (games + prior_games) / mean_goals
+    return attack, defence, home_rate, away_rate
+
+
+def league_strengths(teams, matches, season=CURRENT_SEASON):
+    """
+    Strengths of this season's teams, fitted on the season and its history.
+
+    Promoted teams have no history in the league, so they start from the
+    average strength of the teams they replaced (those relegated last season).
+    """
+    all_teams = np.array(sorted(set(teams) | set(matches['HomeTeam']) | set(matches['AwayTeam'])))
+    n = len(all_teams)
+    home_idx = np.searchsorted(all_teams, matches['HomeTeam'].to_numpy())
+    away_idx = np.searchsorted(all_teams, matches['AwayTeam'].to_numpy())
+    hg = matches['FTHG'].to_numpy(dtype=float)
+    ag = matches['FTAG'].to_numpy(dtype=float)
+    history = previous_seasons(season, HISTORY_SEASONS)
+    season_weights = {season: 1.0, **{s: HISTORY_DECAY ** k for k, s in enumerate(history, 1)}}
+    weights = matches['Season'].map(season_weights).to_numpy(dtype=float)
+
+    attack, defence, home_rate, away_rate = fit_strengths(n, home_idx, away_idx, hg, ag, weights)
+
+    past = matches[matches['Season'] != season]
+    last = matches[matches['Season'] == history[0]] if history else past
+    relegated = (set(last['HomeTeam']) | set(last['AwayTeam'])) - set(teams)
+    promoted = set(teams) - set(past['HomeTeam']) - set(past['AwayTeam'])
+    if relegated and promoted and len(past):
+        rel_idx = np.searchsorted(all_teams, sorted(relegated))
+        new_idx = np.searchsorted(all_teams, sorted(promoted))
+        prior_attack, prior_defence = np.ones(n), np.ones(n)
+        prior_attack[new_idx] = attack[rel_idx].mean()
+        prior_defence[new_idx] = defence[rel_idx].mean()
+        attack, defence, home_rate, away_rate = fit_strengths(
+            n, home_idx, away_idx, hg, ag, weights, prior_attack, prior_defence)
+
+    idx = np.searchsorted(all_teams, teams)
+    return attack[idx], defence[idx], home_rate, away_rate
+
+
+def poisson_cdf_table(lam, max_goals=50):
+    """
+    Cumulative Poisson probabilities P(X <= k) per rate, as float32 columns.
+
+    Stops once every column has rounded to 1.0, since no float32 uniform
+    draw can exceed it.
+    """
+    pmf = np.exp(-lam)
+    cdf = [pmf.copy()]
+    for k in range(1, max_goals):
+        pmf = pmf * lam / k
+        cdf.append(cdf[-1] + pmf)
+        if np.all(cdf[-1].astype(np.float32) >= 1.0):
+            break
+    return np.array(cdf, dtype=np.float32)
+
+
+def sample_goals(rng, cdf_table, n_sims):
+    """Inverse-CDF Poisson sampling: much faster than rng.poisson for small rates"""
+    u = rng.random((n_sims, cdf_table.shape[1]), dtype=np.float32)
+    goals = np.zeros(u.shape, dtype=np.uint8)
+    above = np.empty(u.shape, dtype=bool)
+    for cdf in cdf_table:
+        np.greater_equal(u, cdf, out=above)
+        goals += above.view(np.uint8)
+    return goals
+
+
+def remaining_fixtures(n_teams, home_idx, away_idx):
+    """(home, away) team indices of every home/away pairing not yet played"""
+    played = np.zeros((n_teams, n_teams), dtype=bool)
+    played[home_idx, away_idx] = True
+    np.fill_diagonal(played, True)
+    return np.nonzero(~played)
+
+
+def simulate_league(teams, home_idx, away_idx, hg, ag, n_sims=N_SIMS,
+                    seed=None, chunk_size=CHUNK_SIZE, strengths=None):
+    """
+    Simulate the rest of one league's season.
+
+    `strengths` is (attack, defence, home_rate, away_rate) per team, e.g.
+    from league_strengths(); by default they are fitted on the played matches.
+
+    Returns (position_counts, mean_points, current_points): position_counts
+    is an (n_teams, n_teams) array counting how often team i finished in
+    position j (0 = champions).
+    """
+    rng = np.random.default_rng(seed)
+    n = len(teams)
+
+    # Current standings
+    home_pts = np.select([hg > ag, hg == ag], [3, 1], 0)
+    away_pts = np.select([ag > hg, hg == ag], [3, 1], 0)
+    points = (np.bincount(home_idx, weights=home_pts, minlength=n) +
+              np.bincount(away_idx, weights=away_pts, minlength=n))
+    gf = (np.bincount(home_idx, weights=hg, minlength=n) +
+          np.bincount(away_idx, weights=ag, minlength=n))
+    ga = (np.bincount(home_idx, weights=ag, minlength=n) +
+          np.bincount(away_idx, weights=hg, minlength=n))
+
+    rem_home, rem_away = remaining_fixtures(n, home_idx, away_idx)
+
+    if strengths is None:
+        strengths = fit_strengths(n, home_idx, away_idx, hg, ag)
+    attack, defence, home_rate, away_rate = strengths
+    lam_home = home_rate * attack[rem_home] * defence[rem_away]
+    lam_away = away_rate * attack[rem_away] * defence[rem_home]
+    cdf_home = poisson_cdf_table(lam_home)
+    cdf_away = poisson_cdf_table(lam_away)
+
+    # Fixture -> team incidence matrices, so per-team totals are one matmul
+    n_fixtures = len(rem_home)
+    home_of = np.zeros((n_fixtures, n), dtype=np.float32)
+    away_of = np.zeros((n_fixtures, n), dtype=np.float32)
+    home_of[np.arange(n_fixtures), rem_home] = 1
+    away_of[np.arange(n_fixtures), rem_away] = 1
+
+    position_counts = np.zeros(n * n, dtype=np.int64)
+    points_total = np.zeros(n)
+    positions = np.arange(n)
+
+    for start in range(0, n_sims, chunk_size):
+        m = min(chunk_size, n_sims - start)
+        sim_hg = sample_goals(rng, cdf_home, m)
+        sim_ag = sample_goals(rng, cdf_away, m)
+
+        draw = (sim_hg == sim_ag).astype(np.float32)
+        home_win = (sim_hg > sim_ag).astype(np.float32)
+        sim_home_pts = 3 * home_win + draw
+        sim_away_pts = 3 * (1 - home_win - draw) + draw
+
+        sim_hg = sim_hg.astype(np.float32)
+        sim_ag = sim_ag.astype(np.float32)
+        sim_points = points + sim_home_pts @ home_of + sim_away_pts @ away_of
+        sim_gf = gf + sim_hg @ home_of + sim_ag @ away_of
+        sim_gd = sim_gf - ga - sim_ag @ home_of - sim_hg @ away_of
+
+        # Rank by points, goal difference, goals for (as in league_table)
+        key = (sim_points * 10_000 + sim_gd + 5_000).astype(np.int64) * 1_000 + sim_gf.astype(np.int64)
+        order = np.argsort(-key, axis=1, kind='stable')
+        position_counts += np.bincount((order * n + positions).ravel(), minlength=n * n)
+        points_total += sim_points.sum(axis=0)
+
+    return position_counts.reshape(n, n), points_total / n_sims, points
+
+
+def season_teams(matches, season=CURRENT_SEASON, fixture_teams=()):
+    """Teams of the season: those that have played plus those with upcoming fixtures"""
+    current = matches[matches['Season'] == season]
+    return np.array(sorted(set(current['HomeTeam']) | set(current['AwayTeam']) |
+                           set(fixture_teams)))
+
+
+def _simulate_league_df(league, matches, n_sims, seed, season=CURRENT_SEASON,
+                        fixture_teams=()):
+    """Process pool worker: simulate one league and return its projection table"""
+    # The remaining fixtures are every pairing of the season's teams not yet played
+    teams = season_teams(matches, season, fixture_teams)
+    current = matches[matches['Season'] == season]
+    home_idx = np.searchsorted(teams, current['HomeTeam'].to_numpy())
+    away_idx = np.searchsorted(teams, current['AwayTeam'].to_numpy())
+    hg = current['FTHG'].to_numpy(dtype=float)
+    ag = current['FTAG'].to_numpy(dtype=float)
+
+    counts, mean_points, points = simulate_league(
+        teams, home_idx, away_idx, hg, ag, n_sims=n_sims, seed=seed,
+        strengths=league_strengths(teams, matches, season))
+    probs = counts / n_sims
+    relegation = RELEGATION_PLACES.get(league, 3)
+
+    table = pd.DataFrame({
+        'team': teams,
+        'points': points.astype(int),
+        'expected_points': mean_points.round(1),
+        'title_pct': (100 * probs[:, 0]).round(1),
+        'relegation_pct': (100 * probs[:, -relegation:].sum(axis=1)).round(1),
+    })
+    positions = pd.DataFrame(100 * probs, columns=[f"pos_{i}" for i in range(1, len(teams) + 1)])
+    table = pd.concat([table, positions.round(2)], axis=1)
+    return table.sort_values(['expected_points', 'points'], ascending=False, ignore_index=True)
+
+
+def simulate_season(season=CURRENT_SEASON, leagues=LEAGUES, n_sims=N_SIMS,
+                    seed=None, workers=None, data_dir=DATA_DIR):
+    """Simulate every league in parallel; returns {league: projection DataFrame}"""
+    results = load_results(season, leagues, data_dir)
+    fixture_teams = load_fixture_teams(season, leagues)
+    empty = pd.DataFrame(columns=['Season', 'League', 'HomeTeam', 'AwayTeam', 'FTHG', 'FTAG'])
+    matches = {league: results.get(league, empty) for league in leagues}
+    leagues = [league for league in leagues
+               if len(season_teams(matches[league], season, fixture_teams.get(league, ())))]
+    seeds = np.random.SeedSequence(seed).spawn(len(leagues))
+    workers = workers or min(len(leagues), os.cpu_count() or 1)
+
+    if not leagues:
+        return {}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        tables = pool.map(_simulate_league_df, leagues,
+                          [matches[league] for league in leagues],
+                          [n_sims] * len(leagues), seeds, [season] * len(leagues),
+                          [fixture_teams.get(league, ()) for league in leagues])
+        return dict(zip(leagues, tables))
+
+
+def print_projection(league, season, table):
+    """Print a projected final table"""
+    print(f"\n=== {league} Projection - Season {season} ===")
+    print(f"{'Pos':<4} {'Team':<20} {'Pts':>4} {'xPts':>6} {'Title%':>7} {'Releg%':>7}")
+    print("-" * 52)
+    for i, row in enumerate(table.itertuples(), 1):
+        print(f"{i:<4} {row.team:<20} {row.points:>4} {row.expected_points:>6} "
+              f"{row.title_pct:>7} {row.relegation_pct:>7}")
+
+
+def main(season=CURRENT_SEASON, leagues=LEAGUES, n_sims=N_SIMS, seed=None):
+    """Simulate and print projected tables for every league"""
+    start = time.perf_counter()
+    tables = simulate_season(season, leagues, n_sims, seed)
+    elapsed = time.perf_counter() - start
+
+    for league, table in tables.items():
+        print_projection(league, season, table)
+
+    print(f"\n✓ Simulated {len(tables)} leagues × {n_sims:,} seasons in {elapsed:.1f}s")
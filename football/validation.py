@@ -0,0 +1,148 @@
+"""
+Row validation between loading a CSV and writing it to football.db.
+
+Every check works on whole columns at once and yields one boolean mask:
+
+    missing_ftr        no full-time result
+    missing_goals      FTHG or FTAG missing or not a number
+    ftr_mismatch       FTR disagrees with FTHG/FTAG
+    bad_date           Date could not be parsed (coerced to NaT)
+    impossible_odds    a bookmaker price <= 1.0 or above MAX_ODDS
+    duplicate_fixture  same league, date, home and away team as an earlier row
+
+Rows failing any check are kept out of matches and stored in the quarantine
+table with their reasons; quality_metrics holds the per-file counts.
+valid_rows_sql() applies the same checks to the DuckDB all_matches view,
+which reads the CSV and archive files directly.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from football.match_store import column_group
+
+CHECKS = ['missing_ftr', 'missing_goals', 'ftr_mismatch', 'bad_date', 'impossible_odds',
+          'duplicate_fixture']
+FIXTURE_KEY = ['League', 'Date', 'HomeTeam', 'AwayTeam']
+# Highest price exchanges accept; anything above is a data-entry error
+MAX_ODDS = 1000.0
+# Odds-group columns that are not prices: Asian handicap sizes and bookmaker counts
+NON_PRICE_COLUMNS = {
+    'AHh', 'AHCh', 'BbAHh', 'B365AH', 'GBAH', 'LBAH',  # handicap sizes (e.g. -0.5, 0.25)
+    'Bb1X2', 'BbOU', 'BbAH',                           # number of bookmakers
+}
+# Any other handicap-size column (prices end in AHH/AHA/CAHH/CAHA instead)
+HANDICAP_SIZE = re.compile(r'AH(C?h)?$')
+
+QUARANTINE_TABLE = 'quarantine'
+METRICS_TABLE = 'quality_metrics'
+
+
+def is_price(column):
+    """True for a bookmaker price column (decimal odds)"""
+    return (column_group(column) == 'odds' and column not in NON_PRICE_COLUMNS
+            and not HANDICAP_SIZE.search(column))
+
+
+def price_columns(df):
+    """Numeric bookmaker price columns of a matches frame"""
+    return [c for c in df.select_dtypes('number').columns if is_price(c)]
+
+
+def _column(df, name):
+    if name in df.columns:
+        return df[name]
+    return pd.Series(np.nan, index=df.index)
+
+
+def check(df):
+    """Boolean frame with one column per check (True = row fails it)"""
+    ftr = _column(df, 'FTR')
+    hg = pd.to_numeric(_column(df, 'FTHG'), errors='coerce')
+    ag = pd.to_numeric(_column(df, 'FTAG'), errors='coerce')
+    expected = pd.Series(np.select([hg > ag, hg < ag], ['H', 'A'], 'D'), index=df.index)
+
+    prices = df[price_columns(df)].to_numpy(dtype=float)
+    with np.errstate(invalid='ignore'):
+        bad_prices = ((prices <= 1.0) | (prices > MAX_ODDS)).any(axis=1)
+
+    key = [c for c in FIXTURE_KEY if c in df.columns]
+    return pd.DataFrame({
+        'missing_ftr': ftr.isna(),
+        'missing_goals': hg.isna() | ag.isna(),
+        'ftr_mismatch': ftr.notna() & hg.notna() & ag.notna() & (ftr != expected),
+        'bad_date': _column(df, 'Date').isna(),
+        'impossible_odds': bad_prices,
+        'duplicate_fixture': df.duplicated(subset=key) if key else False,
+    }, index=df.index)
+
+
+def validate(df):
+    """Split a frame into (clean rows, quarantined rows, per-file metrics)"""
+    flags = check(df)
+    failed = flags.any(axis=1).to_numpy()
+
+    quarantined = df[failed].copy()
+    # Boolean-by-string product concatenates the names of the failed checks
+    quarantined['Reason'] = flags[failed].dot(flags.columns + ',').str.rstrip(',')
+
+    sources = _column(df, 'Source_File').fillna('')
+    metrics = flags.groupby(sources).sum()
+    metrics.insert(0, 'quarantined', pd.Series(failed, index=df.index).groupby(sources).sum())
+    metrics.insert(0, 'rows', sources.groupby(sources).size())
+    metrics = metrics.rename_axis('Source_File').reset_index()
+
+    # Clean files (the usual case) are passed through without a copy
+    clean = df[~failed].copy() if failed.any() else df
+    return clean, quarantined, metrics
+
+
+def print_metrics(metrics):
+    """One line per file that had rows quarantined"""
+    for row in metrics[metrics['quarantined'] > 0].itertuples(index=False):
+        failed = ', '.join(f"{name} {getattr(row, name)}" for name in CHECKS
+                           if getattr(row, name))
+        print(f"✗ {row.Source_File}: quarantined {row.quarantined}/{row.rows} rows ({failed})")
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def valid_rows_sql(source, columns, order_by):
+    """
+    SQL selecting the rows of `source` (a query with these columns) that pass check().
+
+    As in check(), the first row of a fixture in `order_by` order counts as
+    the original even when it fails another check, so both copies are left out.
+    """
+    columns = set(columns)
+    hg = "TRY_CAST(FTHG AS DOUBLE)" if 'FTHG' in columns else "NULL"
+    ag = "TRY_CAST(FTAG AS DOUBLE)" if 'FTAG' in columns else "NULL"
+    ftr = "FTR" if 'FTR' in columns else "NULL"
+    # CSV dates may be sniffed as DATE or left as dd/mm/yy(yy) text
+    date = ("COALESCE(TRY_CAST(Date AS DATE), "
+            "TRY_STRPTIME(CAST(Date AS VARCHAR), '%d/%m/%Y'), "
+            "TRY_STRPTIME(CAST(Date AS VARCHAR), '%d/%m/%y'))" if 'Date' in columns else "NULL")
+    conditions = [
+        "_fixture_row = 1",
+        f"{ftr} IS NOT NULL",
+        f"{hg} IS NOT NULL AND {ag} IS NOT NULL",
+        f"{ftr} = CASE WHEN {hg} > {ag} THEN 'H' WHEN {hg} < {ag} THEN 'A' ELSE 'D' END",
+        f"{date} IS NOT NULL",
+    ]
+    for column in sorted(c for c in columns if is_price(c)):
+        price = f"TRY_CAST({_quote(column)} AS DOUBLE)"
+        conditions.append(f"COALESCE({price} > 1.0 AND {price} <= {MAX_ODDS}, TRUE)")
+
+    key = ', '.join(_quote(c) for c in FIXTURE_KEY if c in columns)
+    where = '\n          AND '.join(conditions)
+    # Number the rows before filtering so a failing first row still claims its fixture
+    return f"""
+        SELECT * EXCLUDE (_fixture_row) FROM (
+            SELECT *, ROW_NUMBER() OVER (PARTITION BY {key} ORDER BY {order_by}) AS _fixture_row
+            FROM ({source})
+        )
+        WHERE {where}
+    """
@@ -0,0 +1,120 @@
+"""Archive tier: freezing, checksums and the frozen-plus-live views"""
+import random
+import sqlite3
+
+import duckdb
+import pytest
+
+from football import archive, ingest
+
+HEADER = "Div,Date,HomeTeam,AwayTeam,FTHG,FTAG,FTR,HS,AS,HC,AC,B365H\n"
+
+
+def write_season_csv(path, season, league, seed):
+    rng = random.Random(seed)
+    teams = [f"{league}Team{i}" for i in range(6)]
+    year = 2000 + int(season[:2])
+    lines = [HEADER]
+    for i, (home, away) in enumerate((h, a) for h in teams for a in teams if h != a):
+        hg, ag = rng.randint(0, 4), rng.randint(0, 3)
+        ftr = 'H' if hg > ag else 'A' if ag > hg else 'D'
+        lines.append(f"{league},{1 + i % 28:02d}/{8 + i // 28:02d}/{year},{home},{away},"
+                     f"{hg},{ag},{ftr},{rng.randint(5, 20)},{rng.randint(5, 20)},"
+                     f"{rng.randint(0, 10)},{rng.randint(0, 10)},2.5\n")
+    path.write_text(''.join(lines))
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    for seed, season in enumerate(['2324', '2425']):
+        for league in ['E0', 'D1']:
+            write_season_csv(data_dir / f"{season}_{league}.csv", season, league, seed)
+    return data_dir
+
+
+def view_totals(data_dir, archive_dir):
+    con = duckdb.connect()
+    archive.create_views(con, data_dir, archive_dir)
+    matches = con.execute("SELECT COUNT(*) FROM all_matches").fetchone()[0]
+    stats = con.execute("""
+        SELECT League, Season, matches, results, home_wins, draws, away_wins,
+               CAST(result_home_goals AS DOUBLE), CAST(scored_away_goals AS DOUBLE),
+               CAST(shots AS DOUBLE), shots_n, CAST(corners AS DOUBLE), corners_n
+        FROM league_season_stats ORDER BY League, Season
+    """).fetchall()
+    return matches, stats
+
+
+def test_frozen_views_match_csv_views(data_dir, tmp_path):
+    csv_only = view_totals(data_dir, tmp_path / 'no_archive')
+    ingest.freeze_seasons(['2324'], data_dir, tmp_path / 'archive')
+    assert archive.archived_seasons(tmp_path / 'archive') == {'2324'}
+    assert view_totals(data_dir, tmp_path / 'archive') == csv_only
+    assert csv_only[0] == 4 * 30
+
+
+def test_read_season_round_trip(data_dir, tmp_path):
+    ingest.freeze_seasons(['2324'], data_dir, tmp_path / 'archive')
+    df = archive.read_season('2324', tmp_path / 'archive')
+    assert len(df) == 60
+    assert df['Date'].str.match(r'\d{4}-\d{2}-\d{2}$').all()
+
+
+def test_sources_unchanged(data_dir, tmp_path):
+    archive_dir = tmp_path / 'archive'
+    sources = sorted(data_dir.glob('2324_*.csv'))
+    assert not archive.sources_unchanged('2324', sources, archive_dir)
+    ingest.freeze_seasons(['2324'], data_dir, archive_dir)
+    assert archive.sources_unchanged('2324', sources, archive_dir)
+    write_season_csv(sources[0], '2324', 'D1', seed=99)
+    assert not archive.sources_unchanged('2324', sources, archive_dir)
+
+
+def test_verify_archive_detects_corruption(data_dir, tmp_path):
+    archive_dir = tmp_path / 'archive'
+    ingest.freeze_seasons(['2324'], data_dir, archive_dir)
+    assert archive.verify_archive(archive_dir) == []
+
+    parquet = archive_dir / 'matches' / '2324.parquet'
+    parquet.write_bytes(parquet.read_bytes()[:-10] + b'corrupted!')
+    assert archive.verify_archive(archive_dir) == [f"2324: checksum mismatch for {parquet}"]
+    assert not archive.report(archive_dir)
+
+
+def test_rebuild_restores_the_frozen_quarantine(data_dir, tmp_path):
+    archive_dir = tmp_path / 'archive'
+    with open(data_dir / '2324_E0.csv', 'a') as f:
+        f.write("E0,20/09/2023,E0Team0,E0Team9,0,2,H,10,8,5,4,2.5\n")
+    ingest.freeze_seasons(['2324'], data_dir, archive_dir)
+    assert archive.verify_archive(archive_dir) == []
+
+    db_path = tmp_path / 'football.db'
+    ingest.create_database(sorted(data_dir.glob('*.csv')), db_path, archive_dir=archive_dir)
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT COUNT(*) FROM matches").fetchone() == (4 * 30,)
+    assert conn.execute("SELECT Source_File, AwayTeam, Reason FROM quarantine").fetchall() == [
+        ('2324_E0.csv', 'E0Team9', 'ftr_mismatch')]
+    assert conn.execute("""
+        SELECT rows, quarantined, ftr_mismatch FROM quality_metrics
+        WHERE Source_File = '2324_E0.csv'
+    """).fetchone() == (31, 1, 1)
+    assert conn.execute("SELECT COUNT(*) FROM quality_metrics").fetchone() == (4,)
+    conn.close()
+
+
+def test_minimal_columns_csv(tmp_path):
+    # Old files have no shots or corners; the views must still build
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    (data_dir / '9394_E0.csv').write_text(
+        "Div,Date,HomeTeam,AwayTeam,FTHG,FTAG,FTR\n"
+        "E0,14/08/1993,Arsenal,Coventry,0,3,A\n"
+        "E0,14/08/1993,Aston Villa,QPR,4,1,H\n")
+    con = duckdb.connect()
+    archive.create_views(con, data_dir, tmp_path / 'archive')
+    assert con.execute("SELECT COUNT(*) FROM all_matches").fetchone() == (2,)
+    assert con.execute(
+        "SELECT matches, home_wins, away_wins, shots, shots_n, corners FROM league_season_stats"
+    ).fetchall() == [(2, 1, 1, None, 0, None)]
@@ -0,0 +1,112 @@
+"""Catalog ingestion: season codes, extra-league files and skip/resume"""
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from football import catalog, config
+
+MAIN_CSV = ("Div,Date,HomeTeam,AwayTeam,FTHG,FTAG,FTR\n"
+            "E0,14/08/93,Arsenal,Coventry,0,3,A\n"
+            "E0,14/08/93,Aston Villa,QPR,4,1,H\n")
+EXTRA_CSV = ("Country,League,Season,Date,Time,Home,Away,HG,AG,Res,PH,PD,PA\n"
+             "Argentina,Liga Profesional,2012/2013,03/08/2012,23:00,Arsenal,Union,1,0,H,1.9,3.2,4.5\n"
+             "Argentina,Liga Profesional,2013/2014,02/08/2013,23:00,Boca,River,2,2,D,2.5,3.0,3.0\n")
+CALENDAR_CSV = ("Country,League,Season,Date,Time,Home,Away,HG,AG,Res\n"
+                "Brazil,Serie A,2012,19/05/2012,21:00,Palmeiras,Portuguesa,1,1,D\n"
+                ",,,,,,,,,\n")
+
+ENTRIES = [
+    {'season': '9394', 'league': 'E0', 'file': '9394_E0.csv', 'url': ''},
+    {'season': None, 'league': 'ARG', 'file': 'new_ARG.csv', 'url': ''},
+]
+
+
+@pytest.mark.parametrize('value, code', [
+    ('2012/2013', '1213'), ('1999/2000', '9900'), (2012, '1212'), (2012.0, '1212'), ('2024', '2424'),
+])
+def test_season_code(value, code):
+    assert catalog.season_code(value) == code
+
+
+def test_season_start_year():
+    assert config.season_start_year('9394') == 1993
+    assert config.season_start_year('2425') == 2024
+
+
+def test_select_filters_main_seasons_only():
+    entries = ENTRIES + [{'season': '2425', 'league': 'E0', 'file': '2425_E0.csv', 'url': ''}]
+    assert [e['file'] for e in catalog.select(entries, since='0506')] == ['new_ARG.csv', '2425_E0.csv']
+    assert [e['file'] for e in catalog.select(entries, leagues=['E0'])] == ['9394_E0.csv', '2425_E0.csv']
+
+
+def test_extra_league_layout(tmp_path):
+    path = tmp_path / 'new_ARG.csv'
+    path.write_text(EXTRA_CSV)
+    df = catalog.load_entry(ENTRIES[1], path)
+    assert df[['Season', 'League', 'Div', 'HomeTeam', 'FTHG', 'FTR', 'PSH']].values.tolist()[0] == [
+        '1213', 'ARG', 'ARG', 'Arsenal', 1, 'H', 1.9]
+    assert df['League_Name'].iloc[0] == 'Liga Profesional'
+    assert catalog.load_entry(ENTRIES[1], path, since='1314')['Season'].tolist() == ['1314']
+
+
+def test_calendar_year_file_with_padding_row(tmp_path):
+    path = tmp_path / 'new_BRA.csv'
+    path.write_text(CALENDAR_CSV)
+    entry = {'season': None, 'league': 'BRA', 'file': 'new_BRA.csv', 'url': ''}
+    assert catalog.load_entry(entry, path)['Season'].tolist() == ['1212']
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Catalog and downloaded files in tmp_path; nothing is fetched"""
+    monkeypatch.chdir(tmp_path)
+    catalog.save_catalog(ENTRIES)
+    (tmp_path / 'data' / 'catalog').mkdir()
+    (tmp_path / 'data' / 'catalog' / '9394_E0.csv').write_text(MAIN_CSV)
+    (tmp_path / 'data' / 'catalog' / 'new_ARG.csv').write_text(EXTRA_CSV)
+    monkeypatch.setattr(catalog, 'download',
+                        lambda entry, session, catalog_dir, refresh: Path(catalog_dir) / entry['file'])
+
+    loaded = []
+    load_entry = catalog.load_entry
+    monkeypatch.setattr(catalog, 'load_entry',
+                        lambda entry, *args: loaded.append(entry['file']) or load_entry(entry, *args))
+    return loaded
+
+
+def seasons(db_path='football.db'):
+    with sqlite3.connect(db_path) as conn:
+        return sorted(s for (s,) in conn.execute("SELECT DISTINCT Season FROM matches"))
+
+
+def test_unchanged_files_are_skipped(workdir):
+    catalog.ingest_catalog()
+    catalog.ingest_catalog()
+    assert workdir == ['9394_E0.csv', 'new_ARG.csv']
+    assert seasons() == ['1213', '1314', '9394']
+
+
+def test_changed_file_is_reloaded(workdir, tmp_path):
+    catalog.ingest_catalog()
+    (tmp_path / 'data' / 'catalog' / '9394_E0.csv').write_text(MAIN_CSV + "E0,15/08/93,Chelsea,Oldham,1,1,D\n")
+    catalog.ingest_catalog()
+    assert workdir == ['9394_E0.csv', 'new_ARG.csv', '9394_E0.csv']
+    with sqlite3.connect('football.db') as conn:
+        assert conn.execute("SELECT COUNT(*) FROM matches WHERE League = 'E0'").fetchone() == (3,)
+
+
+def test_earlier_since_reloads_extra_league_files(workdir):
+    catalog.ingest_catalog(since='1314')
+    assert seasons() == ['1314']
+    catalog.ingest_catalog(since='1213')
+    assert seasons() == ['1213', '1314']
+
+
+def test_missing_rows_are_reingested(workdir):
+    catalog.ingest_catalog()
+    with sqlite3.connect('football.db') as conn:
+        conn.execute("DELETE FROM matches WHERE Source_File = 'new_ARG.csv'")
+    catalog.ingest_catalog()
+    assert workdir == ['9394_E0.csv', 'new_ARG.csv', 'new_ARG.csv']
+    assert seasons() == ['1213', '1314', '9394']
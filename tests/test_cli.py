@@ -0,0 +1,29 @@
+"""Argument handling of the football CLI"""
+import pytest
+
+from football import analysis
+from football.cli import main
+
+
+@pytest.fixture
+def query_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(analysis, 'setup_view', lambda: None)
+    monkeypatch.setattr(analysis, 'custom_query', lambda sql: calls.append(('sql', sql)))
+    monkeypatch.setattr(analysis, 'interactive_mode', lambda: calls.append(('interactive',)))
+    return calls
+
+
+def test_query_runs_sql(query_calls):
+    main(['query', 'SELECT 1'])
+    assert query_calls == [('sql', 'SELECT 1')]
+
+
+def test_query_without_sql_is_interactive(query_calls):
+    main(['query'])
+    assert query_calls == [('interactive',)]
+
+
+def test_query_interactive_flag_after_sql(query_calls):
+    main(['query', 'SELECT 1', '-i'])
+    assert query_calls == [('sql', 'SELECT 1'), ('interactive',)]
@@ -0,0 +1,107 @@
+"""Poisson / Dixon-Coles goal model"""
+import numpy as np
+import pandas as pd
+
+from football import goal_model
+
+MU, HOME = 0.1, 0.25
+
+
+def synthetic_matches(league, n_teams, rounds, seed):
+    """Double round robins with goals drawn from known strengths"""
+    rng = np.random.default_rng(seed)
+    attack = rng.normal(0, 0.3, n_teams)
+    defence = rng.normal(0, 0.3, n_teams)
+    attack, defence = attack - attack.mean(), defence - defence.mean()
+    teams = [f"{league} team {i:02d}" for i in range(n_teams)]
+
+    rows = []
+    day = pd.Timestamp('2024-08-01')
+    for _ in range(rounds):
+        for h in range(n_teams):
+            for a in range(n_teams):
+                if h == a:
+                    continue
+                rows.append({
+                    'League': league, 'Season': '2425', 'Date': day.strftime('%Y-%m-%d'),
+                    'HomeTeam': teams[h], 'AwayTeam': teams[a],
+                    'FTHG': rng.poisson(np.exp(MU + HOME + attack[h] - defence[a])),
+                    'FTAG': rng.poisson(np.exp(MU + attack[a] - defence[h])),
+                })
+                day += pd.Timedelta(hours=6)
+    return pd.DataFrame(rows), attack, defence
+
+
+def fit(matches, stored=None):
+    tasks, skipped = goal_model.build_tasks(matches, stored)
+    return goal_model.fit_batch(tasks), tasks, skipped
+
+
+def test_recovers_known_parameters():
+    e0, e0_attack, e0_defence = synthetic_matches('E0', 12, 20, seed=0)
+    d1, d1_attack, d1_defence = synthetic_matches('D1', 10, 20, seed=1)
+    fits, _, _ = fit(pd.concat([e0, d1], ignore_index=True))
+
+    truth = {'E0': (e0_attack, e0_defence), 'D1': (d1_attack, d1_defence)}
+    for f in fits:
+        attack, defence = truth[f['League']]
+        # Strengths are identified up to a shift absorbed by mu
+        assert abs(f['home'] - HOME) < 0.1
+        assert np.abs(f['attack'] - f['attack'].mean() - attack).max() < 0.15
+        assert np.abs(f['defence'] - f['defence'].mean() - defence).max() < 0.15
+        assert f['converged']
+
+
+def test_save_and_load_round_trip(tmp_path):
+    db_path = tmp_path / 'football.db'
+    matches, _, _ = synthetic_matches('E0', 6, 2, seed=2)
+    fits, _, _ = fit(matches)
+    goal_model.save_fits(fits, db_path)
+    goal_model.save_fits(fits, db_path)  # refits replace the stored rows
+
+    stored = goal_model.load_fits(db_path)
+    assert list(stored) == [('E0', '2425')]
+    entry, f = stored[('E0', '2425')], fits[0]
+    assert entry['teams'] == f['teams']
+    assert entry['n_matches'] == len(matches)
+    assert entry['goals_checksum'] == f['goals_checksum']
+    np.testing.assert_allclose(
+        entry['params'], np.concatenate([[f['mu'], f['home']], f['attack'], f['defence']]))
+
+
+def test_build_tasks_skips_unchanged_and_warm_starts(tmp_path):
+    db_path = tmp_path / 'football.db'
+    matches, _, _ = synthetic_matches('E0', 6, 2, seed=3)
+    fits, _, _ = fit(matches)
+    goal_model.save_fits(fits, db_path)
+    stored = goal_model.load_fits(db_path)
+
+    tasks, skipped = goal_model.build_tasks(matches.sample(frac=1, random_state=0), stored)
+    assert (tasks, skipped) == ([], 1)
+
+    # A corrected score keeps the match count but must still be refitted
+    corrected = matches.copy()
+    corrected.loc[0, 'FTHG'] += 1
+    tasks, skipped = goal_model.build_tasks(corrected, stored)
+    assert skipped == 0 and len(tasks) == 1
+    np.testing.assert_array_equal(tasks[0]['x0'], stored[('E0', '2425')]['params'])
+
+    tasks, _ = goal_model.build_tasks(matches, stored, xi=0.002)
+    assert len(tasks) == 1
+
+    # No warm start once the team list changes
+    promoted = matches.replace({'E0 team 05': 'E0 team 99'})
+    tasks, _ = goal_model.build_tasks(promoted, stored)
+    assert 'x0' not in tasks[0]
+
+
+def test_match_probabilities_sum_to_one(tmp_path):
+    db_path = tmp_path / 'football.db'
+    matches, _, _ = synthetic_matches('E0', 6, 4, seed=4)
+    fits, _, _ = fit(matches)
+    goal_model.save_fits(fits, db_path)
+
+    probs = goal_model.match_probabilities('E0 team 00', 'E0 team 01', 'E0', '2425', db_path)
+    total = probs['home_win'] + probs['draw'] + probs['away_win']
+    assert abs(total - 1) < 1e-3
+    assert probs['home_xg'] > 0 and probs['away_xg'] > 0
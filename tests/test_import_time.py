@@ -0,0 +1,72 @@
+"""Import-time regression tests for the football CLI"""
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must only be imported by the subcommands that need them
+HEAVY_MODULES = ['pandas', 'numpy', 'scipy', 'duckdb', 'requests']
+
+# Extra startup time allowed for `football --help` on top of a bare interpreter
+HELP_BUDGET_SECONDS = 0.15
+
+
+def run_python(code, cwd=ROOT):
+    result = subprocess.run(
+        [sys.executable, '-c', code], cwd=cwd, env={**os.environ, 'PYTHONPATH': str(ROOT)},
+        capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def loaded_heavy_modules(statement, cwd=ROOT):
+    """Heavy modules in sys.modules after running statement"""
+    output = run_python(
+        "import sys\n"
+        f"{statement}\n"
+        f"print('\\n' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))",
+        cwd)
+    # The last line is ours; anything before it is the command's own output
+    return [m for m in output.splitlines()[-1].split(',') if m]
+
+
+def best_of(code, runs=5):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run_python(code)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_import_package_is_light():
+    assert loaded_heavy_modules("import football, football.config, football.cli") == []
+
+
+def test_help_is_light():
+    statement = (
+        "from football.cli import main\n"
+        "try:\n"
+        "    main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass")
+    assert loaded_heavy_modules(statement) == []
+
+
+def test_archive_verify_is_light(tmp_path):
+    statement = "from football.cli import main\nmain(['freeze', '--verify'])"
+    assert loaded_heavy_modules(statement, cwd=tmp_path) == []
+
+
+def test_help_starts_quickly():
+    baseline = best_of("pass")
+    help_time = best_of(
+        "from football.cli import main\n"
+        "try:\n"
+        "    main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass")
+    assert help_time - baseline < HELP_BUDGET_SECONDS
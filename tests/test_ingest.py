@@ -0,0 +1,47 @@
+"""Column reconciliation and date parsing of football-data CSVs"""
+import pandas as pd
+
+from football import ingest
+
+
+def test_old_and_extra_league_columns_are_renamed():
+    df = pd.DataFrame(columns=['HT', 'AT', 'HG', 'AG', 'Res', 'PH', 'BbAvH', 'BbMx>2.5'])
+    assert list(ingest.normalise_columns(df).columns) == [
+        'HomeTeam', 'AwayTeam', 'FTHG', 'FTAG', 'FTR', 'PSH', 'AvgH', 'Max>2.5']
+
+
+def test_alias_does_not_overwrite_canonical_column():
+    df = pd.DataFrame({'AvgH': [2.0], 'BbAvH': [2.1]})
+    df = ingest.normalise_columns(df)
+    assert list(df.columns) == ['AvgH', 'BbAvH']
+    assert df['AvgH'].tolist() == [2.0]
+
+
+def test_padding_columns_and_rows_are_dropped():
+    df = pd.DataFrame({' HomeTeam ': ['Arsenal', None], 'AwayTeam': ['QPR', None],
+                       'Unnamed: 2': [None, None]})
+    df = ingest.normalise_columns(df)
+    assert list(df.columns) == ['HomeTeam', 'AwayTeam']
+    assert len(df) == 1
+
+
+def test_trailing_commas_do_not_shift_columns(tmp_path):
+    path = tmp_path / '9394_E0.csv'
+    path.write_text("Div,Date,HomeTeam,AwayTeam,FTHG,FTAG,FTR\n"
+                    "E0,14/08/93,Arsenal,Coventry,0,3,A,,,\n")
+    df = ingest.load_csv_with_metadata(path)
+    assert df.loc[0, 'HomeTeam'] == 'Arsenal'
+    assert df.loc[0, 'FTR'] == 'A'
+    assert (df.loc[0, 'Season'], df.loc[0, 'League']) == ('9394', 'E0')
+
+
+def test_latin1_file(tmp_path):
+    path = tmp_path / '9495_SP1.csv'
+    path.write_bytes("Div,Date,HomeTeam,AwayTeam\nSP1,04/09/94,Logroñés,Betis\n".encode('latin-1'))
+    assert ingest.load_csv_with_metadata(path).loc[0, 'HomeTeam'] == 'Logroñés'
+
+
+def test_two_and_four_digit_years():
+    df = pd.DataFrame({'Date': ['14/08/93', '11/08/2017', '32/08/2017', None]})
+    assert ingest.iso_dates(df)['Date'].tolist()[:2] == ['1993-08-14', '2017-08-11']
+    assert df['Date'].isna().tolist() == [False, False, True, True]
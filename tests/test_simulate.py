@@ -0,0 +1,66 @@
+"""Monte Carlo season simulator"""
+import numpy as np
+
+from football import queries, simulate
+
+TEAMS = np.array(['Alpha', 'Bravo', 'Charlie', 'Delta'])
+PAIRS = [(h, a) for h in range(4) for a in range(4) if h != a]
+# A full season with every team on 9 points: Delta and Bravo are separated by
+# goal difference, Alpha and Charlie (both -2) by goals for
+SCORES = [(0, 3), (2, 1), (1, 3), (2, 3), (3, 2), (0, 2),
+          (0, 3), (2, 1), (1, 0), (2, 0), (1, 2), (1, 2)]
+EXPECTED_ORDER = ['Delta', 'Bravo', 'Alpha', 'Charlie']
+
+
+def season_arrays(pairs=PAIRS, scores=SCORES):
+    home_idx = np.array([h for h, _ in pairs])
+    away_idx = np.array([a for _, a in pairs])
+    hg = np.array([s[0] for s in scores], dtype=float)
+    ag = np.array([s[1] for s in scores], dtype=float)
+    return home_idx, away_idx, hg, ag
+
+
+def test_tie_breaking_matches_league_table(tmp_path, monkeypatch, capsys):
+    (tmp_path / 'data').mkdir()
+    lines = ["Div,Date,HomeTeam,AwayTeam,FTHG,FTAG,FTR\n"]
+    for i, ((h, a), (hg, ag)) in enumerate(zip(PAIRS, SCORES)):
+        ftr = 'H' if hg > ag else 'A' if ag > hg else 'D'
+        lines.append(f"E0,{i + 1:02d}/09/2024,{TEAMS[h]},{TEAMS[a]},{hg},{ag},{ftr}\n")
+    (tmp_path / 'data' / '2425_E0.csv').write_text(''.join(lines))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(queries, '_con', None)
+
+    queries.league_table('E0', '2425')
+    table = capsys.readouterr().out.split('-' * 75 + '\n')[1].splitlines()
+    assert [line.split()[1] for line in table] == EXPECTED_ORDER
+
+    # No fixtures left, so every simulation ends with the same table
+    counts, _, points = simulate.simulate_league(TEAMS, *season_arrays(), n_sims=50, seed=0)
+    assert points.tolist() == [9, 9, 9, 9]
+    assert [TEAMS[counts[:, pos].argmax()] for pos in range(4)] == EXPECTED_ORDER
+    assert (counts.max(axis=0) == 50).all()
+
+
+def test_remaining_fixtures_are_the_unplayed_pairings():
+    played = [(0, 1), (2, 3), (3, 0), (1, 2)]
+    home_idx, away_idx, _, _ = season_arrays(played, [(1, 0)] * len(played))
+    rem_home, rem_away = simulate.remaining_fixtures(4, home_idx, away_idx)
+    remaining = list(zip(rem_home.tolist(), rem_away.tolist()))
+    assert sorted(remaining) == sorted(set(PAIRS) - set(played))
+    assert len(remaining) == len(set(remaining))
+
+
+def test_position_counts_sum_to_n_sims():
+    played = PAIRS[:5]
+    home_idx, away_idx, hg, ag = season_arrays(played, SCORES[:5])
+    counts, mean_points, points = simulate.simulate_league(
+        TEAMS, home_idx, away_idx, hg, ag, n_sims=2_500, seed=1, chunk_size=1_000)
+    assert (counts.sum(axis=0) == 2_500).all()
+    assert (counts.sum(axis=1) == 2_500).all()
+    # 7 fixtures left: each hands out 2 (draw) or 3 points
+    assert points.sum() + 2 * 7 <= mean_points.sum() <= points.sum() + 3 * 7
+
+
+def test_previous_seasons():
+    assert simulate.previous_seasons('2526') == ['2425', '2324']
+    assert simulate.previous_seasons('0001', 2) == ['9900', '9899']
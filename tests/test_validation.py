@@ -0,0 +1,95 @@
+"""Row validation, in pandas (ingest) and in the DuckDB all_matches view"""
+import duckdb
+import pandas as pd
+import pytest
+
+from football import archive, ingest, queries, validation
+
+HEADER = "Div,Date,HomeTeam,AwayTeam,FTHG,FTAG,FTR,HS,AS,HC,AC,B365H,B365D,B365A,B365AH,GBAH,AHh,Bb1X2\n"
+ROWS = {
+    'valid': "E0,10/08/2024,Arsenal,Chelsea,2,1,H,10,8,5,4,2.1,3.4,3.5,-0.5,0.25,-1.5,40\n",
+    'missing_ftr': "E0,11/08/2024,Everton,Fulham,1,1,,10,8,5,4,2.1,3.4,3.5,,,,\n",
+    'missing_goals': "E0,12/08/2024,Arsenal,Everton,,,H,10,8,5,4,2.1,3.4,3.5,,,,\n",
+    'ftr_mismatch': "E0,13/08/2024,Chelsea,Fulham,0,2,H,10,8,5,4,2.1,3.4,3.5,,,,\n",
+    'bad_date': "E0,32/08/2024,Fulham,Arsenal,1,0,H,10,8,5,4,2.1,3.4,3.5,,,,\n",
+    'impossible_odds': "E0,14/08/2024,Everton,Chelsea,1,0,H,10,8,5,4,1.0,3.4,3.5,,,,\n",
+    'duplicate_fixture': "E0,10/08/2024,Arsenal,Chelsea,2,1,H,10,8,5,4,2.1,3.4,3.5,-0.5,0.25,-1.5,40\n",
+}
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    (tmp_path / 'data').mkdir()
+    (tmp_path / 'data' / '2425_E0.csv').write_text(HEADER + ''.join(ROWS.values()))
+    return tmp_path / 'data'
+
+
+def test_each_check(data_dir):
+    flags = validation.check(ingest.load_csv_with_metadata(data_dir / '2425_E0.csv'))
+    for i, name in enumerate(ROWS):
+        failed = [check for check in validation.CHECKS if flags.iloc[i][check]]
+        if name == 'valid':
+            assert failed == []
+        elif name == 'missing_goals':
+            assert failed == ['missing_goals']
+        else:
+            assert failed == [name]
+
+
+def test_handicap_sizes_and_counts_are_not_prices():
+    for column in ['AHh', 'AHCh', 'BbAHh', 'B365AH', 'GBAH', 'LBAH', 'Bb1X2', 'BbOU', 'BbAH']:
+        assert not validation.is_price(column), column
+    for column in ['B365H', 'AvgA', 'B365AHH', 'PCAHA', 'Max>2.5', 'PSCH']:
+        assert validation.is_price(column), column
+    assert not validation.is_price('FTHG')
+
+
+def test_negative_handicap_line_is_not_quarantined():
+    df = pd.DataFrame({'League': ['E0'], 'Date': ['2010-08-14'], 'HomeTeam': ['A'],
+                       'AwayTeam': ['B'], 'FTHG': [1], 'FTAG': [0], 'FTR': ['H'],
+                       'B365AH': [-0.5], 'GBAH': [0.25], 'LBAH': [0.0], 'B365AHH': [1.9]})
+    assert not validation.check(df).any(axis=None)
+
+
+def test_validate_splits_rows_and_counts_per_file(data_dir):
+    df = ingest.load_csv_with_metadata(data_dir / '2425_E0.csv')
+    clean, quarantined, metrics = validation.validate(df)
+    assert clean['HomeTeam'].tolist() == ['Arsenal']
+    assert quarantined['Reason'].tolist() == list(ROWS)[1:]
+    assert metrics[['Source_File', 'rows', 'quarantined']].values.tolist() == [['2425_E0.csv', 7, 6]]
+
+
+def matches_in_view(data_dir, archive_dir):
+    con = duckdb.connect()
+    archive.create_views(con, data_dir, archive_dir)
+    return con.execute("SELECT HomeTeam, AwayTeam FROM all_matches").fetchall()
+
+
+def test_view_leaves_out_invalid_csv_rows(data_dir, tmp_path):
+    assert matches_in_view(data_dir, tmp_path / 'archive') == [('Arsenal', 'Chelsea')]
+
+
+def test_view_leaves_out_invalid_archived_rows(data_dir, tmp_path):
+    # An archive frozen before validation existed still holds the bad rows
+    df = ingest.load_csv_with_metadata(data_dir / '2425_E0.csv')
+    archive.write_season(df, '2425', [data_dir / '2425_E0.csv'], tmp_path / 'archive')
+    assert matches_in_view(data_dir, tmp_path / 'archive') == [('Arsenal', 'Chelsea')]
+
+
+def test_view_drops_both_copies_when_the_first_fails(tmp_path):
+    # The first Everton-Chelsea row has impossible odds, the repeat is otherwise fine
+    rows = [ROWS['valid'], ROWS['impossible_odds'], ROWS['impossible_odds'].replace(',1.0,', ',2.1,')]
+    (tmp_path / 'data').mkdir()
+    (tmp_path / 'data' / '2425_E0.csv').write_text(HEADER + ''.join(rows))
+
+    df = ingest.load_csv_with_metadata(tmp_path / 'data' / '2425_E0.csv')
+    _, quarantined, _ = validation.validate(df)
+    assert quarantined['Reason'].tolist() == ['impossible_odds', 'duplicate_fixture']
+    assert matches_in_view(tmp_path / 'data', tmp_path / 'archive') == [('Arsenal', 'Chelsea')]
+
+
+def test_head_to_head_skips_rows_without_goals(data_dir, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(queries, '_con', None)
+    queries.head_to_head('Arsenal', 'Everton')
+    assert 'No matches found' in capsys.readouterr().out